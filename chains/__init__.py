@@ -0,0 +1,11 @@
+"""
+Attack Chain Core Package
+Author: Victor Ibhafidon
+
+Makes chains/ importable as a regular package from the repository root, so
+target helpers can use plain package imports instead of putting chains/ on
+sys.path.
+
+USAGE:
+    from chains.chain_analyzer import ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
+"""
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared Strings - Text Constants for the Static Example Chains
+Author: Victor Ibhafidon
+
+Holds text that appears verbatim in more than one static chain.
+
+WHAT IT DOES:
+- Defines each repeated endpoint, context, prerequisite and outcome once
+- Interns the strings so every chain references the same object
+
+HOW IT CONNECTS TO THE FRAMEWORK:
+- Used by the mobile-analysis chain scripts in targets/robotics/mobile_analysis_work
+- Feeds ChainSpec definitions (chain_spec.py) that become AttackChain objects
+
+USAGE:
+    from chains._strings import IROBOT_HOME_APP, ROBOT_CONTROL_API
+"""
+
+import sys
+from typing import Final
+
+# Chain descriptions, contexts and prerequisites
+MOBILE_RE_DESCRIPTION: Final[str] = sys.intern(
+    "Chained vulnerabilities discovered via mobile app reverse engineering"
+)
+IROBOT_HOME_CONTEXT: Final[str] = sys.intern("iRobot Home robot vacuum control application")
+IROBOT_HOME_APP: Final[str] = sys.intern("iRobot Home mobile app")
+DECOMPILED_CODE_ACCESS: Final[str] = sys.intern("Access to decompiled app code")
+
+# Step endpoints
+MOBILE_APP_ANALYSIS: Final[str] = sys.intern("Mobile app analysis: apktool + jadx")
+JAVA_CODE_ANALYSIS: Final[str] = sys.intern("Java code analysis")
+ROBOT_CONTROL_API: Final[str] = sys.intern("Robot control API")
+
+# Step outcomes
+ROBOT_CONTROL_ACHIEVED: Final[str] = sys.intern("Unauthorized robot control achieved")
@@ -31,14 +31,30 @@ USAGE:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import AbstractSet, Iterable, List, Dict, Optional, Sequence
 from enum import Enum
 from datetime import datetime
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:  # optional speedup for export/import; stdlib json otherwise
+    orjson = None
 
-class VulnerabilityType(Enum):
-    """Types of vulnerabilities that can be chained"""
+# ChainStep/AttackChain use __slots__ where dataclasses support it (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Write buffer for the stdlib json export path
+_EXPORT_BUFFER_SIZE = 1 << 16
+
+
+class VulnerabilityType(str, Enum):
+    """Types of vulnerabilities that can be chained
+
+    The str mixin makes members real strings, so equality and hashing run
+    in C and json/orjson encode them directly as their value.
+    """
     XSS = "Cross-Site Scripting"
     SQL_INJECTION = "SQL Injection"
     IDOR = "Insecure Direct Object Reference"
@@ -55,15 +71,15 @@ class VulnerabilityType(Enum):
     OTHER = "Other"
 
 
-class ImpactLevel(Enum):
-    """Impact levels for attack chains"""
+class ImpactLevel(str, Enum):
+    """Impact levels for attack chains (str-valued, like VulnerabilityType)"""
     LOW = "Low"
     MEDIUM = "Medium"
     HIGH = "High"
     CRITICAL = "Critical"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ChainStep:
     """Represents a single step in an attack chain"""
     step_number: int
@@ -71,7 +87,7 @@ class ChainStep:
     description: str
     endpoint: Optional[str] = None
     payload: Optional[str] = None
-    prerequisites: List[str] = field(default_factory=list)
+    prerequisites: Sequence[str] = field(default_factory=list)
     outcome: Optional[str] = None
     evidence: Optional[str] = None
     
@@ -83,13 +99,27 @@ class ChainStep:
             "description": self.description,
             "endpoint": self.endpoint,
             "payload": self.payload,
-            "prerequisites": self.prerequisites,
+            "prerequisites": list(self.prerequisites),
             "outcome": self.outcome,
             "evidence": self.evidence
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ChainStep':
+        """Create ChainStep from dictionary (inverse of to_dict)"""
+        return cls(
+            step_number=data["step_number"],
+            vulnerability_type=VulnerabilityType(data["vulnerability_type"]),
+            description=data["description"],
+            endpoint=data.get("endpoint"),
+            payload=data.get("payload"),
+            prerequisites=data.get("prerequisites", []),
+            outcome=data.get("outcome"),
+            evidence=data.get("evidence")
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AttackChain:
     """Represents a complete attack chain"""
     title: str
@@ -97,12 +127,13 @@ class AttackChain:
     steps: List[ChainStep] = field(default_factory=list)
     impact: ImpactLevel = ImpactLevel.MEDIUM
     severity: str = ""
-    prerequisites: List[str] = field(default_factory=list)
+    # Builders may share immutable tuples/frozensets here; copy before mutating
+    prerequisites: Sequence[str] = field(default_factory=list)
     context: Optional[str] = None
     discovered_by: Optional[str] = None
     discovered_at: Optional[datetime] = None
     validated: bool = False
-    tags: Set[str] = field(default_factory=set)
+    tags: AbstractSet[str] = field(default_factory=set)
     
     def __post_init__(self):
         if self.discovered_at is None:
@@ -113,6 +144,11 @@ class AttackChain:
         self.steps.append(step)
         self.steps.sort(key=lambda x: x.step_number)
     
+    def add_steps(self, steps: Iterable[ChainStep]):
+        """Add several steps at once, sorting only once"""
+        self.steps.extend(steps)
+        self.steps.sort(key=lambda x: x.step_number)
+    
     def get_chain_summary(self) -> str:
         """Get a summary of the attack chain"""
         summary = []
@@ -169,7 +205,7 @@ class AttackChain:
                 # 1. Previous steps in the chain (their outcomes)
                 # 2. Chain-level prerequisites (available from the start)
                 previous_outcomes = [s.outcome for s in self.steps[:i] if s.outcome]
-                chain_prereqs = self.prerequisites if self.prerequisites else []
+                chain_prereqs = list(self.prerequisites) if self.prerequisites else []
                 all_available = previous_outcomes + chain_prereqs
                 
                 # Check each prerequisite for this step
@@ -260,7 +296,7 @@ class AttackChain:
             "steps": [step.to_dict() for step in self.steps],
             "impact": self.impact.value,
             "severity": self.severity,
-            "prerequisites": self.prerequisites,
+            "prerequisites": list(self.prerequisites),
             "context": self.context,
             "discovered_by": self.discovered_by,
             "discovered_at": self.discovered_at.isoformat() if self.discovered_at else None,
@@ -271,34 +307,42 @@ class AttackChain:
     @classmethod
     def from_dict(cls, data: Dict) -> 'AttackChain':
         """Create AttackChain from dictionary"""
-        chain = cls(
+        # Sort once rather than per add_step()
+        steps = [ChainStep.from_dict(step_data) for step_data in data.get("steps", [])]
+        steps.sort(key=lambda x: x.step_number)
+        discovered_at = data.get("discovered_at")
+        return cls(
             title=data["title"],
             description=data["description"],
+            steps=steps,
             impact=ImpactLevel(data["impact"]),
             severity=data.get("severity", ""),
             prerequisites=data.get("prerequisites", []),
             context=data.get("context"),
             discovered_by=data.get("discovered_by"),
-            validated=data.get("validated", False)
+            discovered_at=datetime.fromisoformat(discovered_at) if discovered_at else None,
+            validated=data.get("validated", False),
+            tags=set(data.get("tags", []))
         )
-        if "discovered_at" in data and data["discovered_at"]:
-            chain.discovered_at = datetime.fromisoformat(data["discovered_at"])
-        
-        for step_data in data.get("steps", []):
-            step = ChainStep(
-                step_number=step_data["step_number"],
-                vulnerability_type=VulnerabilityType(step_data["vulnerability_type"]),
-                description=step_data["description"],
-                endpoint=step_data.get("endpoint"),
-                payload=step_data.get("payload"),
-                prerequisites=step_data.get("prerequisites", []),
-                outcome=step_data.get("outcome"),
-                evidence=step_data.get("evidence")
-            )
-            chain.add_step(step)
-        
-        chain.tags = set(data.get("tags", []))
-        return chain
+
+
+def _dump_json(data, filename: str):
+    """Write data to filename as indented JSON (uses orjson when installed)"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2)
+
+
+def _load_json(filename: str):
+    """Parse a JSON file (uses orjson when installed)"""
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 class ChainAnalyzer:
@@ -335,18 +379,28 @@ class ChainAnalyzer:
         return results
     
     def export_chain(self, chain: AttackChain, filename: str):
-        """Export a chain to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(chain.to_dict(), f, indent=2)
+        """Export a chain to JSON file (uses orjson when installed)"""
+        _dump_json(chain.to_dict(), filename)
+    
+    def export_chains(self, chains: Iterable[AttackChain], filename: str):
+        """Export several chains to one JSON file as an array of chain objects"""
+        _dump_json([chain.to_dict() for chain in chains], filename)
     
     def import_chain(self, filename: str) -> AttackChain:
-        """Import a chain from JSON file"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        chain = AttackChain.from_dict(data)
+        """Import a chain from JSON file (uses orjson when installed)"""
+        chain = AttackChain.from_dict(_load_json(filename))
         self.chains.append(chain)
         return chain
     
+    def import_chains(self, filename: str) -> List[AttackChain]:
+        """Import every chain from a JSON file written by export_chains() or export_chain()"""
+        data = _load_json(filename)
+        if isinstance(data, dict):
+            data = [data]
+        chains = [AttackChain.from_dict(item) for item in data]
+        self.chains.extend(chains)
+        return chains
+    
     def generate_report(self) -> str:
         """Generate a comprehensive report of all chains"""
         report = []
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Chain Spec - Declarative Definitions for Static Attack Chains
+Author: Victor Ibhafidon
+
+Describes a fixed attack chain as plain data so example scripts don't need a
+hand-written builder per chain.
+
+WHAT IT DOES:
+- ChainSpec holds everything a static chain needs: metadata, prerequisites, tags, steps
+- build_chain() turns a spec into a fresh AttackChain registered with an analyzer
+- build_standalone_chain() does the same with a new analyzer per call
+
+HOW IT CONNECTS TO THE FRAMEWORK:
+- Builds AttackChain/ChainStep objects from chain_analyzer.py
+- Used by the robotics example scripts in targets/robotics
+
+USAGE:
+    from chains.chain_spec import ChainSpec, build_chain
+
+    spec = ChainSpec(title="...", description="...", impact=ImpactLevel.HIGH,
+                     severity="High", context="...", prerequisites=(...),
+                     tags=frozenset({...}), steps=((1, VulnerabilityType.OTHER, "..."),))
+    chain = build_chain(ChainAnalyzer(), spec)
+    analyzer, chain = build_standalone_chain(spec)
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from chains.chain_analyzer import AttackChain, ChainAnalyzer, ChainStep, ImpactLevel
+
+
+@dataclass(frozen=True)
+class ChainSpec:
+    """Immutable description of one attack chain
+
+    Each entry in steps is a tuple of ChainStep constructor arguments in
+    field order (step_number, vulnerability_type, description, endpoint,
+    payload, prerequisites, outcome). Specs are shared, so every field holds
+    immutable values that chains can reference without copying.
+    """
+    title: str
+    description: str
+    impact: ImpactLevel
+    severity: str
+    context: Optional[str]
+    prerequisites: Tuple[str, ...]
+    tags: FrozenSet[str]
+    steps: Tuple[tuple, ...]
+
+
+def build_chain(analyzer: ChainAnalyzer, spec: ChainSpec) -> AttackChain:
+    """Create a new chain from spec and register it with analyzer"""
+    chain = analyzer.create_chain(
+        title=spec.title,
+        description=spec.description,
+        impact=spec.impact
+    )
+    chain.prerequisites = spec.prerequisites
+    chain.context = spec.context
+    chain.tags = spec.tags
+    chain.severity = spec.severity
+    chain.add_steps([ChainStep(*row) for row in spec.steps])
+    return chain
+
+
+def build_standalone_chain(spec: ChainSpec) -> Tuple[ChainAnalyzer, AttackChain]:
+    """Build spec into a new analyzer of its own, returning (analyzer, chain)
+
+    Each call gets a fresh analyzer holding just this chain, so calling a
+    builder repeatedly never accumulates chains in a shared analyzer.
+    """
+    analyzer = ChainAnalyzer()
+    return analyzer, build_chain(analyzer, spec)
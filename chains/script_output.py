@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Script Output - Console Formatting Shared by the Example Chain Scripts
+Author: Victor Ibhafidon
+
+Section banners and per-chain summaries printed by the scripts that build
+and export fixed example chains.
+
+WHAT IT DOES:
+- SEP / banner() draw the "=" bars around section titles
+- chain_report() formats one chain's summary, plus validation issues on request
+
+HOW IT CONNECTS TO THE FRAMEWORK:
+- Formats AttackChain objects from chain_analyzer.py
+- Used by the robotics example scripts in targets/robotics
+
+USAGE:
+    from chains.script_output import banner, chain_report
+
+    print(banner("ROBOTICS ATTACK CHAIN EXAMPLES"))
+    print(chain_report(chain, "Example 1", validate=True))
+"""
+
+from chains.chain_analyzer import AttackChain
+
+SEP = "=" * 80
+
+
+def banner(title: str) -> str:
+    """Three-line section header: title between two separator bars"""
+    return f"{SEP}\n{title}\n{SEP}"
+
+
+def chain_report(chain: AttackChain, heading: str, validate: bool = False) -> str:
+    """Summary text for one chain, with validation issues when requested"""
+    out = ["\n" + banner(heading), chain.get_chain_summary()]
+    if validate:
+        is_valid, issues = chain.validate_chain()
+        if not is_valid:
+            out.append("\n Validation Issues:")
+            out.extend(f" {issue}" for issue in issues)
+    return "\n".join(out)
@@ -11,6 +11,8 @@ WHAT IT DOES:
 - Tests fuzzy matching for similar prerequisites
 - Tests missing outcome detection
 - Tests empty chain validation
+- Tests that validation results and summaries track changes to a chain
+- Tests that exported chains (single object and array files) import back unchanged
 
 HOW IT CONNECTS TO THE FRAMEWORK:
 - Tests the validation logic in chain_analyzer.py
@@ -24,6 +26,7 @@ USAGE:
 
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.dirname(__file__))
 
 from chain_analyzer import (
@@ -38,14 +41,14 @@ def test_basic_validation():
  
  analyzer = ChainAnalyzer()
  chain = analyzer.create_chain(
- title="Test Chain",
- description="A valid test chain",
- impact=ImpactLevel.HIGH
+  title="Test Chain",
+  description="A valid test chain",
+  impact=ImpactLevel.HIGH
  )
  
  step1 = ChainStep(1, VulnerabilityType.XSS, "XSS in profile", outcome="XSS stored")
- step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access", 
- prerequisites=["XSS stored"], outcome="Data accessed")
+ step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access",
+  prerequisites=["XSS stored"], outcome="Data accessed")
  
  chain.add_step(step1)
  chain.add_step(step2)
@@ -53,9 +56,9 @@ def test_basic_validation():
  is_valid, issues = chain.validate_chain()
  print(f"Valid: {is_valid}")
  if issues:
- print("Issues/Suggestions:")
- for issue in issues:
- print(f" {issue}")
+  print("Issues/Suggestions:")
+  for issue in issues:
+   print(f" {issue}")
  print()
 
 def test_missing_prerequisite():
@@ -66,14 +69,14 @@ def test_missing_prerequisite():
  
  analyzer = ChainAnalyzer()
  chain = analyzer.create_chain(
- title="Invalid Chain",
- description="Chain with missing prerequisite",
- impact=ImpactLevel.HIGH
+  title="Invalid Chain",
+  description="Chain with missing prerequisite",
+  impact=ImpactLevel.HIGH
  )
  
  step1 = ChainStep(1, VulnerabilityType.XSS, "XSS in profile", outcome="XSS executed")
- step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access", 
- prerequisites=["Session stolen"], outcome="Data accessed")
+ step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access",
+  prerequisites=["Session stolen"], outcome="Data accessed")
  
  chain.add_step(step1)
  chain.add_step(step2)
@@ -81,9 +84,9 @@ def test_missing_prerequisite():
  is_valid, issues = chain.validate_chain()
  print(f"Valid: {is_valid}")
  if issues:
- print("Issues/Suggestions:")
- for issue in issues:
- print(f" {issue}")
+  print("Issues/Suggestions:")
+  for issue in issues:
+   print(f" {issue}")
  print()
 
 def test_fuzzy_matching():
@@ -94,15 +97,15 @@ def test_fuzzy_matching():
  
  analyzer = ChainAnalyzer()
  chain = analyzer.create_chain(
- title="Fuzzy Match Test",
- description="Testing fuzzy prerequisite matching",
- impact=ImpactLevel.HIGH
+  title="Fuzzy Match Test",
+  description="Testing fuzzy prerequisite matching",
+  impact=ImpactLevel.HIGH
  )
  
- step1 = ChainStep(1, VulnerabilityType.XSS, "XSS in profile", 
- outcome="XSS payload stored in profile")
- step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access", 
- prerequisites=["XSS stored"], outcome="Data accessed")
+ step1 = ChainStep(1, VulnerabilityType.XSS, "XSS in profile",
+  outcome="XSS payload stored in profile")
+ step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access",
+  prerequisites=["XSS stored"], outcome="Data accessed")
  
  chain.add_step(step1)
  chain.add_step(step2)
@@ -110,9 +113,9 @@ def test_fuzzy_matching():
  is_valid, issues = chain.validate_chain()
  print(f"Valid: {is_valid}")
  if issues:
- print("Issues/Suggestions:")
- for issue in issues:
- print(f" {issue}")
+  print("Issues/Suggestions:")
+  for issue in issues:
+   print(f" {issue}")
  print()
 
 def test_missing_outcome():
@@ -123,14 +126,14 @@ def test_missing_outcome():
  
  analyzer = ChainAnalyzer()
  chain = analyzer.create_chain(
- title="Missing Outcome Test",
- description="Testing missing outcome detection",
- impact=ImpactLevel.HIGH
+  title="Missing Outcome Test",
+  description="Testing missing outcome detection",
+  impact=ImpactLevel.HIGH
  )
  
  step1 = ChainStep(1, VulnerabilityType.XSS, "XSS in profile") # No outcome
- step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access", 
- prerequisites=["XSS result"], outcome="Data accessed")
+ step2 = ChainStep(2, VulnerabilityType.IDOR, "IDOR access",
+  prerequisites=["XSS result"], outcome="Data accessed")
  
  chain.add_step(step1)
  chain.add_step(step2)
@@ -138,9 +141,9 @@ def test_missing_outcome():
  is_valid, issues = chain.validate_chain()
  print(f"Valid: {is_valid}")
  if issues:
- print("Issues/Suggestions:")
- for issue in issues:
- print(f" {issue}")
+  print("Issues/Suggestions:")
+  for issue in issues:
+   print(f" {issue}")
  print()
 
 def test_empty_chain():
@@ -151,17 +154,116 @@ def test_empty_chain():
  
  analyzer = ChainAnalyzer()
  chain = analyzer.create_chain(
- title="Empty Chain",
- description="Testing empty chain validation",
- impact=ImpactLevel.HIGH
+  title="Empty Chain",
+  description="Testing empty chain validation",
+  impact=ImpactLevel.HIGH
  )
  
  is_valid, issues = chain.validate_chain()
  print(f"Valid: {is_valid}")
  if issues:
- print("Issues/Suggestions:")
- for issue in issues:
- print(f" {issue}")
+  print("Issues/Suggestions:")
+  for issue in issues:
+   print(f" {issue}")
+ print()
+
+def test_edits_reflected():
+ """Test that validation and summaries track changes to the chain"""
+ print("=" * 80)
+ print("TEST 6: Edits Reflected")
+ print("=" * 80)
+ 
+ analyzer = ChainAnalyzer()
+ chain = analyzer.create_chain(
+  title="Edit Test",
+  description="Testing that results follow chain edits",
+  impact=ImpactLevel.HIGH
+ )
+ 
+ chain.add_step(ChainStep(1, VulnerabilityType.XSS, "XSS in profile", outcome="XSS stored"))
+ is_valid, _ = chain.validate_chain()
+ assert is_valid
+ 
+ chain.add_step(ChainStep(2, VulnerabilityType.IDOR, "IDOR access",
+  prerequisites=["Session stolen"], outcome="Data accessed"))
+ is_valid, _ = chain.validate_chain()
+ print(f"Revalidated after add_step: {not is_valid}")
+ assert not is_valid
+ 
+ chain.prerequisites = ["Session stolen"]
+ is_valid, _ = chain.validate_chain()
+ print(f"Revalidated after field assignment: {is_valid}")
+ assert is_valid
+ 
+ chain.steps[1].prerequisites.append("Admin token")
+ is_valid, _ = chain.validate_chain()
+ print(f"Revalidated after in-place step edit: {not is_valid}")
+ assert not is_valid
+ 
+ chain.prerequisites.append("Admin token")
+ is_valid, _ = chain.validate_chain()
+ print(f"Revalidated after in-place prerequisite edit: {is_valid}")
+ assert is_valid
+ 
+ chain.title = "Renamed Edit Test"
+ chain.steps[0].description = "Stored XSS in profile"
+ summary = chain.get_chain_summary()
+ print(f"Summary reflects edits: {'Renamed' in summary and 'Stored XSS' in summary}")
+ assert "Renamed" in summary and "Stored XSS" in summary
+ 
+ steps = chain.to_dict()["steps"]
+ steps[0]["outcome"] = "caller mutation"
+ chain.steps[1].evidence = "Screenshot"
+ exported = chain.to_dict()["steps"]
+ print(f"Step dicts reflect in-place edits: {exported[1]['evidence'] == 'Screenshot'}")
+ assert exported[1]["evidence"] == "Screenshot"
+ assert exported[0]["outcome"] == "XSS stored"
+ print()
+
+def test_export_import_round_trip():
+ """Test that export_chain()/export_chains() output imports back unchanged"""
+ print("=" * 80)
+ print("TEST 7: Export/Import Round Trip")
+ print("=" * 80)
+ 
+ analyzer = ChainAnalyzer()
+ first = analyzer.create_chain(
+  title="Round Trip One",
+  description="Exported alone and in an array",
+  impact=ImpactLevel.HIGH
+ )
+ first.tags = {"web", "xss"}
+ first.prerequisites = ["Account on the target"]
+ first.add_steps([
+  ChainStep(1, VulnerabilityType.XSS, "Stored XSS", endpoint="/profile",
+   payload="<script>", prerequisites=["Account on the target"], outcome="XSS stored"),
+  ChainStep(2, VulnerabilityType.CSRF, "CSRF via XSS", prerequisites=["XSS stored"],
+   outcome="Password changed", evidence="Request log")
+ ])
+ second = analyzer.create_chain(title="Round Trip Two", description="Second chain")
+ second.add_step(ChainStep(1, VulnerabilityType.IDOR, "IDOR on orders"))
+ 
+ def normalized(chain):
+  data = chain.to_dict()
+  data["tags"] = sorted(data["tags"])
+  return data
+ 
+ with tempfile.TemporaryDirectory() as tmp:
+  single = os.path.join(tmp, "single.json")
+  analyzer.export_chain(first, single)
+  reloaded = ChainAnalyzer().import_chain(single)
+  print(f"Single chain round trip: {normalized(reloaded) == normalized(first)}")
+  assert normalized(reloaded) == normalized(first)
+  
+  array = os.path.join(tmp, "array.json")
+  analyzer.export_chains((first, second), array)
+  reloaded = ChainAnalyzer().import_chains(array)
+  same = [normalized(c) for c in reloaded] == [normalized(first), normalized(second)]
+  print(f"Array round trip: {same}")
+  assert same
+  
+  # import_chains() also reads single-object files
+  assert [normalized(c) for c in ChainAnalyzer().import_chains(single)] == [normalized(first)]
  print()
 
 if __name__ == "__main__":
@@ -175,6 +277,8 @@ if __name__ == "__main__":
  test_fuzzy_matching()
  test_missing_outcome()
  test_empty_chain()
+ test_edits_reflected()
+ test_export_import_round_trip()
  
  print("=" * 80)
  print("All tests completed!")
@@ -0,0 +1,12 @@
+"""
+Target Helpers Package
+Author: Victor Ibhafidon
+
+Makes targets/ importable from the repository root, so target scripts can be
+run as modules and share the regular chains package instead of putting
+chains/ on sys.path.
+
+USAGE:
+ python -m targets.robotics.example_chains
+ python -m targets.robotics.mobile_analysis_work.create_chains
+"""
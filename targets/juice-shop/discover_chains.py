@@ -27,101 +27,187 @@ USAGE:
 
 import sys
 import os
-import requests
-from typing import List, Dict
+import importlib.util
+import time
+import heapq
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional, Tuple, Union
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from chain_analyzer import (
+from chains.chain_analyzer import (
  ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
 )
 
+SEP = "=" * 80
+
+# Interned once at import; each chain gets its own mutable copy
+_JUICE_DEFAULT_TAGS = frozenset(map(sys.intern, ("juice-shop", "web")))
+
+# How long a check_connection() result is reused before probing again
+_CONN_CACHE_TTL = 5.0
+
+# Upper bound on concurrent endpoint probes (and pooled keep-alive connections)
+_PROBE_WORKERS = 16
+
+# Static discovery checklist, frozen once at import and shared by every call
+_JUICE_CHECKLIST = tuple(
+ MappingProxyType({"category": category, "tests": tests})
+ for category, tests in (
+  ("Authentication", (
+   "Try default credentials",
+   "Test password reset functionality",
+   "Check for JWT vulnerabilities",
+   "Test session management",
+   "Look for privilege escalation"
+  )),
+  ("Injection", (
+   "SQL Injection in search",
+   "NoSQL Injection in login",
+   "Command Injection in file upload",
+   "LDAP Injection if applicable"
+  )),
+  ("XSS", (
+   "Stored XSS in product reviews",
+   "Reflected XSS in search",
+   "DOM-based XSS",
+   "XSS in user profile"
+  )),
+  ("Business Logic", (
+   "Price manipulation via API",
+   "Quantity manipulation",
+   "Checkout bypass",
+   "Coupon code manipulation",
+   "Race conditions"
+  )),
+  ("API Security", (
+   "Test REST API endpoints",
+   "Check for broken authentication",
+   "Look for excessive data exposure",
+   "Test mass assignment",
+   "Check rate limiting"
+  )),
+  ("Other", (
+   "SSRF vulnerabilities",
+   "XXE if XML parsing exists",
+   "Path traversal",
+   "Insecure deserialization"
+  ))
+ )
+)
+
+# Findings for example_price_manipulation_chain, built once at import
+_PRICE_FINDINGS = (
+ MappingProxyType({
+  "step": 1,
+  "type": VulnerabilityType.BUSINESS_LOGIC,
+  "description": "Price manipulation via API - modify product price in cart",
+  "endpoint": "/api/BasketItems/{id}",
+  "payload": '{"quantity": 1, "ProductId": 1, "BasketId": "...", "price": 0}',
+  "outcome": "Product price set to $0"
+ }),
+ MappingProxyType({
+  "step": 2,
+  "type": VulnerabilityType.BUSINESS_LOGIC,
+  "description": "Add multiple items with manipulated price",
+  "endpoint": "/api/BasketItems",
+  "prerequisites": ("Product price set to $0",),
+  "outcome": "Cart contains free items"
+ }),
+ MappingProxyType({
+  "step": 3,
+  "type": VulnerabilityType.BUSINESS_LOGIC,
+  "description": "Complete checkout with free items",
+  "endpoint": "/api/Orders",
+  "prerequisites": ("Cart contains free items",),
+  "outcome": "Order completed without payment"
+ })
+)
+
 class JuiceShopHelper:
  """Helper for testing Juice Shop"""
  
  def __init__(self, base_url: str = "http://localhost:3000"):
- self.base_url = base_url
- self.session = requests.Session()
- self.analyzer = ChainAnalyzer()
+  self.base_url = base_url
+  # Created on first network call so checklist-only use never imports requests
+  self.session = None
+  # (time.monotonic() of the probe, result) from the last check_connection()
+  self._conn_cache: Optional[Tuple[float, bool]] = None
+  self.analyzer = ChainAnalyzer()
+ 
+ def __enter__(self):
+  return self
+ 
+ def __exit__(self, exc_type, exc_value, traceback):
+  self.close()
+ 
+ def close(self):
+  """Close pooled connections"""
+  if self.session is not None:
+   self.session.close()
+ 
+ def _get_session(self):
+  """Return the pooled requests session, importing requests on first use"""
+  if self.session is None:
+   import requests
+   from requests.adapters import HTTPAdapter
+   session = requests.Session()
+   adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_PROBE_WORKERS)
+   session.mount("http://", adapter)
+   session.mount("https://", adapter)
+   self.session = session
+  return self.session
  
  def check_connection(self) -> bool:
- """Check if Juice Shop is accessible"""
- try:
- response = self.session.get(self.base_url, timeout=2)
- return response.status_code == 200
- except:
- return False
+  """Check if Juice Shop is accessible (result reused for a few seconds)"""
+  now = time.monotonic()
+  if self._conn_cache and now - self._conn_cache[0] < _CONN_CACHE_TTL:
+   return self._conn_cache[1]
+  try:
+   response = self._get_session().get(self.base_url, timeout=2)
+   ok = response.status_code == 200
+  except:
+   ok = False
+  self._conn_cache = (now, ok)
+  return ok
  
- def discover_vulnerabilities(self) -> List[Dict]:
- """
- Guide for discovering vulnerabilities
- Returns a checklist of things to test
- """
- checklist = [
- {
- "category": "Authentication",
- "tests": [
- "Try default credentials",
- "Test password reset functionality",
- "Check for JWT vulnerabilities",
- "Test session management",
- "Look for privilege escalation"
- ]
- },
- {
- "category": "Injection",
- "tests": [
- "SQL Injection in search",
- "NoSQL Injection in login",
- "Command Injection in file upload",
- "LDAP Injection if applicable"
- ]
- },
- {
- "category": "XSS",
- "tests": [
- "Stored XSS in product reviews",
- "Reflected XSS in search",
- "DOM-based XSS",
- "XSS in user profile"
- ]
- },
- {
- "category": "Business Logic",
- "tests": [
- "Price manipulation via API",
- "Quantity manipulation",
- "Checkout bypass",
- "Coupon code manipulation",
- "Race conditions"
- ]
- },
- {
- "category": "API Security",
- "tests": [
- "Test REST API endpoints",
- "Check for broken authentication",
- "Look for excessive data exposure",
- "Test mass assignment",
- "Check rate limiting"
- ]
- },
- {
- "category": "Other",
- "tests": [
- "SSRF vulnerabilities",
- "XXE if XML parsing exists",
- "Path traversal",
- "Insecure deserialization"
- ]
- }
- ]
- return checklist
+ def reset_cache(self):
+  """Forget the cached check_connection() result"""
+  self._conn_cache = None
+ 
+ def _fetch_status(self, path: str) -> Optional[int]:
+  """GET a single path on the target, returning its status code"""
+  import requests
+  try:
+   return self._get_session().get(self.base_url.rstrip("/") + path, timeout=2).status_code
+  except requests.RequestException:
+   return None
+ 
+ def probe_endpoints(self, paths: List[str]) -> Dict[str, Optional[int]]:
+  """
+  Probe several endpoints concurrently over the pooled session
+  Returns {path: status_code}, with None for requests that failed
+  """
+  if not paths:
+   return {}
+  self._get_session()  # create it once, before the worker threads race for it
+  with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(paths))) as executor:
+   return dict(zip(paths, executor.map(self._fetch_status, paths)))
+ 
+ def discover_vulnerabilities(self) -> Tuple[Mapping[str, Any], ...]:
+  """
+  Guide for discovering vulnerabilities
+  Returns a checklist of things to test
+  """
+  return _JUICE_CHECKLIST
  
  def create_chain_from_findings(self, title: str, description: str, 
- findings: List[Dict]) -> None:
- """
+ findings: Union[List[Dict], List[List[Dict]]]) -> None:
+  """
  Create an attack chain from discovered vulnerabilities
  
  findings format:
@@ -136,107 +222,103 @@ class JuiceShopHelper:
  },
  ...
  ]
+ 
+ findings may also be a list of such lists (one per discovery source),
+ each already sorted by step; they are then merged instead of re-sorted.
  """
- chain = self.analyzer.create_chain(
- title=title,
- description=description,
- impact=ImpactLevel.HIGH
- )
+  chain = self.analyzer.create_chain(
+   title=title,
+   description=description,
+   impact=ImpactLevel.HIGH
+  )
  
- chain.context = "OWASP Juice Shop"
- chain.tags = {"juice-shop", "web"}
+  chain.context = "OWASP Juice Shop"
+  chain.tags = set(_JUICE_DEFAULT_TAGS)
  
- for finding in sorted(findings, key=lambda x: x["step"]):
- step = ChainStep(
- step_number=finding["step"],
- vulnerability_type=finding["type"],
- description=finding["description"],
- endpoint=finding.get("endpoint"),
- payload=finding.get("payload"),
- outcome=finding.get("outcome")
- )
- chain.add_step(step)
+  if findings and isinstance(findings[0], (list, tuple)):
+   ordered = heapq.merge(*findings, key=itemgetter("step"))
+  else:
+   ordered = sorted(findings, key=itemgetter("step"))
  
- # Validate
- is_valid, issues = chain.validate_chain()
+  # Drop exact duplicate findings, keeping step order
+  unique = {}
+  for finding in ordered:
+   key = (
+    finding["step"],
+    finding["type"],
+    finding["description"],
+    finding.get("endpoint"),
+    finding.get("payload"),
+    finding.get("outcome")
+   )
+   unique.setdefault(key, finding)
  
- if not is_valid:
- print(" Chain validation issues:")
- for issue in issues:
- print(f" - {issue}")
+  chain.add_steps(
+   ChainStep(
+    step_number=finding["step"],
+    vulnerability_type=finding["type"],
+    description=finding["description"],
+    endpoint=finding.get("endpoint"),
+    payload=finding.get("payload"),
+    outcome=finding.get("outcome")
+   )
+   for finding in unique.values()
+  )
  
- self.analyzer.chains.append(chain)
- return chain
+  # Validate
+  is_valid, issues = chain.validate_chain()
  
- def print_discovery_guide(self):
- """Print a guide for discovering vulnerabilities"""
- print("=" * 80)
- print("JUICE SHOP VULNERABILITY DISCOVERY GUIDE")
- print("=" * 80)
- print()
+  if not is_valid:
+   print(" Chain validation issues:")
+   for issue in issues:
+    print(f" - {issue}")
  
- if not self.check_connection():
- print(" Cannot connect to Juice Shop at", self.base_url)
- print(" Make sure it's running: bash targets/juice-shop/setup.sh")
- return
+  self.analyzer.chains.append(chain)
+  return chain
  
- print(" Connected to Juice Shop")
- print()
+ def print_discovery_guide(self):
+  """Print a guide for discovering vulnerabilities"""
+  out = [SEP, "JUICE SHOP VULNERABILITY DISCOVERY GUIDE", SEP, ""]
  
- checklist = self.discover_vulnerabilities()
+  if not self.check_connection():
+   out.append(f" Cannot connect to Juice Shop at {self.base_url}")
+   out.append(" Make sure it's running: bash targets/juice-shop/setup.sh")
+   sys.stdout.write("\n".join(out) + "\n")
+   return
  
- for category in checklist:
- print(f" {category['category']}")
- for test in category['tests']:
- print(f" {test}")
- print()
+  out.append(" Connected to Juice Shop")
+  out.append("")
  
- print("=" * 80)
- print("NEXT STEPS")
- print("=" * 80)
- print()
- print("1. Test each item in the checklist")
- print("2. Document findings as you discover them")
- print("3. Look for relationships between vulnerabilities")
- print("4. Build attack chains using create_chain_from_findings()")
- print("5. Use chain_analyzer.py to document complete chains")
- print()
+  out.append("\n\n".join(
+   f" {category['category']}\n" + "\n".join(f" {test}" for test in category['tests'])
+   for category in self.discover_vulnerabilities()
+  ))
+  out.append("")
+ 
+  out += [
+   SEP,
+   "NEXT STEPS",
+   SEP,
+   "",
+   "1. Test each item in the checklist",
+   "2. Document findings as you discover them",
+   "3. Look for relationships between vulnerabilities",
+   "4. Build attack chains using create_chain_from_findings()",
+   "5. Use chain_analyzer.py to document complete chains",
+   ""
+  ]
+  sys.stdout.write("\n".join(out) + "\n")
 
 def example_price_manipulation_chain():
  """Example: Price manipulation attack chain"""
  helper = JuiceShopHelper()
  
- findings = [
- {
- "step": 1,
- "type": VulnerabilityType.BUSINESS_LOGIC,
- "description": "Price manipulation via API - modify product price in cart",
- "endpoint": "/api/BasketItems/{id}",
- "payload": '{"quantity": 1, "ProductId": 1, "BasketId": "...", "price": 0}',
- "outcome": "Product price set to $0"
- },
- {
- "step": 2,
- "type": VulnerabilityType.BUSINESS_LOGIC,
- "description": "Add multiple items with manipulated price",
- "endpoint": "/api/BasketItems",
- "prerequisites": ["Product price set to $0"],
- "outcome": "Cart contains free items"
- },
- {
- "step": 3,
- "type": VulnerabilityType.BUSINESS_LOGIC,
- "description": "Complete checkout with free items",
- "endpoint": "/api/Orders",
- "prerequisites": ["Cart contains free items"],
- "outcome": "Order completed without payment"
- }
- ]
+ findings = _PRICE_FINDINGS
  
  chain = helper.create_chain_from_findings(
- title="Juice Shop - Price Manipulation to Free Purchase",
- description="Chained business logic flaws allowing free product purchase",
- findings=findings
+  title="Juice Shop - Price Manipulation to Free Purchase",
+  description="Chained business logic flaws allowing free product purchase",
+  findings=findings
  )
  
  chain.impact = ImpactLevel.HIGH
@@ -249,9 +331,9 @@ if __name__ == "__main__":
  helper = JuiceShopHelper()
  helper.print_discovery_guide()
  
- print("\n" + "=" * 80)
+ print("\n" + SEP)
  print("EXAMPLE CHAIN")
- print("=" * 80)
+ print(SEP)
  print()
  example_price_manipulation_chain()
 
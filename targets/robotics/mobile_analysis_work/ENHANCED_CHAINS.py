@@ -19,211 +19,169 @@ HOW IT CONNECTS TO THE FRAMEWORK:
 
 USAGE:
  python targets/robotics/mobile_analysis_work/ENHANCED_CHAINS.py
+ python -m targets.robotics.mobile_analysis_work.ENHANCED_CHAINS
+ python targets/robotics/mobile_analysis_work/ENHANCED_CHAINS.py --validate
 """
 
 import sys
 import os
-import json
+import importlib.util
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from chain_analyzer import (
- ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
+from chains.chain_analyzer import (
+ ChainAnalyzer, VulnerabilityType, ImpactLevel
+)
+from chains.chain_spec import ChainSpec, build_standalone_chain
+from chains.script_output import banner, chain_report
+from chains._strings import (
+ IROBOT_HOME_CONTEXT, IROBOT_HOME_APP, MOBILE_APP_ANALYSIS,
+ JAVA_CODE_ANALYSIS, ROBOT_CONTROL_API, ROBOT_CONTROL_ACHIEVED
 )
 
-def create_enhanced_irobot_chain():
- """Enhanced iRobot chain with new discoveries"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+# Static chain definitions
+_ENHANCED_IROBOT_OUTCOME_1 = sys.intern("Discovery API endpoint identified")
+_ENHANCED_IROBOT_OUTCOME_2 = sys.intern("MQTT broker endpoint and API base URLs discovered")
+_ENHANCED_IROBOT_OUTCOME_3 = sys.intern("MQTT broker accessed, topics enumerated")
+_ENHANCED_IROBOT_OUTCOME_4 = sys.intern("Unauthorized robot commands published via MQTT")
+_ENHANCED_IROBOT_OUTCOME_5 = ROBOT_CONTROL_ACHIEVED
+
+_ENHANCED_IROBOT_SPEC = ChainSpec(
  title="iRobot Home - Discovery API to MQTT to Robot Control",
  description="Chained vulnerabilities from discovery API to MQTT to unauthorized robot control",
- impact=ImpactLevel.CRITICAL
- )
- 
- chain.prerequisites = [
- "iRobot Home mobile app",
- "Network access"
- ]
- chain.context = "iRobot Home robot vacuum control application"
- chain.tags = {"irobot", "roomba", "mobile-app", "mqtt", "api-gateway", "critical"}
- chain.severity = "Critical"
- 
- # Step 1: Reverse Engineering
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Reverse engineered iRobot Home app to discover discovery API endpoint",
- endpoint="Mobile app analysis: apktool + jadx",
- payload="Discovered: https://disc-int-test.iot.irobotapi.com/v1/robot/discover",
- outcome="Discovery API endpoint identified"
- )
- 
- # Step 2: Discovery API Access
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Discovery API accessible without authentication, returns MQTT broker and base URLs",
- endpoint="https://disc-int-test.iot.irobotapi.com/v1/robot/discover?robot_id=TEST&country_code=US",
- prerequisites=["Discovery API endpoint identified"],
- payload='{"discoveryTTL": 84662, "httpBase": "https://unauth1.int-test.iot.irobotapi.com", "mqtt": "agrxftka9i3qm.iot.us-east-1.amazonaws.com", "iotTopics": "$aws", "irbtTopics": "v027-irbthbu"}',
- outcome="MQTT broker endpoint and API base URLs discovered"
- )
- 
- # Step 3: MQTT Broker Access
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Connect to discovered MQTT broker and enumerate topics",
- endpoint="MQTT: agrxftka9i3qm.iot.us-east-1.amazonaws.com",
- prerequisites=["MQTT broker endpoint and API base URLs discovered"],
- payload="MQTT topics: $aws, v027-irbthbu",
- outcome="MQTT broker accessed, topics enumerated"
+ impact=ImpactLevel.CRITICAL,
+ severity="Critical",
+ context=IROBOT_HOME_CONTEXT,
+ prerequisites=(
+  IROBOT_HOME_APP,
+  "Network access"
+ ),
+ tags=frozenset({"irobot", "roomba", "mobile-app", "mqtt", "api-gateway", "critical"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: Reverse Engineering
+  (1, VulnerabilityType.OTHER,
+   "Reverse engineered iRobot Home app to discover discovery API endpoint",
+   MOBILE_APP_ANALYSIS,
+   "Discovered: https://disc-int-test.iot.irobotapi.com/v1/robot/discover",
+   (),
+   _ENHANCED_IROBOT_OUTCOME_1),
+  # Step 2: Discovery API Access
+  (2, VulnerabilityType.OTHER,
+   "Discovery API accessible without authentication, returns MQTT broker and base URLs",
+   "https://disc-int-test.iot.irobotapi.com/v1/robot/discover?robot_id=TEST&country_code=US",
+   '{"discoveryTTL": 84662, "httpBase": "https://unauth1.int-test.iot.irobotapi.com", "mqtt": "agrxftka9i3qm.iot.us-east-1.amazonaws.com", "iotTopics": "$aws", "irbtTopics": "v027-irbthbu"}',
+   (_ENHANCED_IROBOT_OUTCOME_1,),
+   _ENHANCED_IROBOT_OUTCOME_2),
+  # Step 3: MQTT Broker Access
+  (3, VulnerabilityType.OTHER,
+   "Connect to discovered MQTT broker and enumerate topics",
+   "MQTT: agrxftka9i3qm.iot.us-east-1.amazonaws.com",
+   "MQTT topics: $aws, v027-irbthbu",
+   (_ENHANCED_IROBOT_OUTCOME_2,),
+   _ENHANCED_IROBOT_OUTCOME_3),
+  # Step 4: MQTT Topic Publishing
+  (4, VulnerabilityType.BUSINESS_LOGIC,
+   "Publish robot control commands to MQTT topics without authentication",
+   "MQTT topic: v027-irbthbu",
+   '{"command": "start", "robot_id": "..."}',
+   (_ENHANCED_IROBOT_OUTCOME_3,),
+   _ENHANCED_IROBOT_OUTCOME_4),
+  # Step 5: Robot Control Achieved
+  (5, VulnerabilityType.BUSINESS_LOGIC,
+   "Robot executes commands from MQTT, unauthorized control achieved",
+   "Robot device",
+   None,
+   (_ENHANCED_IROBOT_OUTCOME_4,),
+   _ENHANCED_IROBOT_OUTCOME_5)
  )
- 
- # Step 4: MQTT Topic Publishing
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Publish robot control commands to MQTT topics without authentication",
- endpoint="MQTT topic: v027-irbthbu",
- prerequisites=["MQTT broker accessed, topics enumerated"],
- payload='{"command": "start", "robot_id": "..."}',
- outcome="Unauthorized robot commands published via MQTT"
- )
- 
- # Step 5: Robot Control Achieved
- step5 = ChainStep(
- step_number=5,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Robot executes commands from MQTT, unauthorized control achieved",
- endpoint="Robot device",
- prerequisites=["Unauthorized robot commands published via MQTT"],
- outcome="Unauthorized robot control achieved"
- )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- chain.add_step(step5)
- 
- return analyzer, chain
+)
 
-def create_ifttt_integration_chain():
- """Attack chain via IFTTT integration"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+_IFTTT_OUTCOME_1 = sys.intern("IFTTT integration endpoints discovered")
+_IFTTT_OUTCOME_2 = sys.intern("IFTTT authentication mechanism identified")
+_IFTTT_OUTCOME_3 = sys.intern("Unauthorized robot access via IFTTT")
+_IFTTT_OUTCOME_4 = ROBOT_CONTROL_ACHIEVED
+
+_IFTTT_SPEC = ChainSpec(
  title="iRobot Home - IFTTT Integration to Robot Control",
  description="Exploiting IFTTT integration vulnerabilities for unauthorized robot control",
- impact=ImpactLevel.HIGH
+ impact=ImpactLevel.HIGH,
+ severity="High",
+ context="iRobot Home with IFTTT integration",
+ prerequisites=(
+  IROBOT_HOME_APP,
+  "IFTTT account"
+ ),
+ tags=frozenset({"irobot", "ifttt", "integration", "api"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: Discover IFTTT Endpoints
+  (1, VulnerabilityType.OTHER,
+   "Reverse engineered app to discover IFTTT integration endpoints",
+   JAVA_CODE_ANALYSIS,
+   "Discovered: https://integrate-prod.iot.irobotapi.com/account-linking/ifttt",
+   (),
+   _IFTTT_OUTCOME_1),
+  # Step 2: Test IFTTT Authentication
+  (2, VulnerabilityType.AUTH_BYPASS,
+   "Test IFTTT integration for authentication bypass or token reuse",
+   "https://integrate-prod.iot.irobotapi.com/account-linking/ifttt",
+   None,
+   (_IFTTT_OUTCOME_1,),
+   _IFTTT_OUTCOME_2),
+  # Step 3: Access Robot via IFTTT
+  (3, VulnerabilityType.IDOR,
+   "Access unauthorized robots via IFTTT integration",
+   "IFTTT API",
+   None,
+   (_IFTTT_OUTCOME_2,),
+   _IFTTT_OUTCOME_3),
+  # Step 4: Execute Commands
+  (4, VulnerabilityType.BUSINESS_LOGIC,
+   "Execute robot commands via IFTTT integration",
+   ROBOT_CONTROL_API,
+   None,
+   (_IFTTT_OUTCOME_3,),
+   _IFTTT_OUTCOME_4)
  )
- 
- chain.prerequisites = [
- "iRobot Home mobile app",
- "IFTTT account"
- ]
- chain.context = "iRobot Home with IFTTT integration"
- chain.tags = {"irobot", "ifttt", "integration", "api"}
- chain.severity = "High"
- 
- # Step 1: Discover IFTTT Endpoints
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Reverse engineered app to discover IFTTT integration endpoints",
- endpoint="Java code analysis",
- payload="Discovered: https://integrate-prod.iot.irobotapi.com/account-linking/ifttt",
- outcome="IFTTT integration endpoints discovered"
- )
- 
- # Step 2: Test IFTTT Authentication
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.AUTH_BYPASS,
- description="Test IFTTT integration for authentication bypass or token reuse",
- endpoint="https://integrate-prod.iot.irobotapi.com/account-linking/ifttt",
- prerequisites=["IFTTT integration endpoints discovered"],
- outcome="IFTTT authentication mechanism identified"
- )
- 
- # Step 3: Access Robot via IFTTT
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.IDOR,
- description="Access unauthorized robots via IFTTT integration",
- endpoint="IFTTT API",
- prerequisites=["IFTTT authentication mechanism identified"],
- outcome="Unauthorized robot access via IFTTT"
- )
- 
- # Step 4: Execute Commands
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Execute robot commands via IFTTT integration",
- endpoint="Robot control API",
- prerequisites=["Unauthorized robot access via IFTTT"],
- outcome="Unauthorized robot control achieved"
- )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- 
- return analyzer, chain
+)
 
-if __name__ == "__main__":
- print("=" * 80)
- print("ENHANCED ATTACK CHAINS - NEW DISCOVERIES")
- print("=" * 80)
- print()
- 
- # Enhanced iRobot Chain
- print("\n" + "=" * 80)
- print("Enhanced iRobot Chain: Discovery API → MQTT → Robot Control")
- print("=" * 80)
- analyzer1, chain1 = create_enhanced_irobot_chain()
- is_valid, issues = chain1.validate_chain()
- print(chain1.get_chain_summary())
- if not is_valid:
- print("\n Validation Issues:")
- for issue in issues:
- print(f" {issue}")
- analyzer1.chains.append(chain1)
- 
- # Export
- output_file1 = "irobot_enhanced_chain.json"
- analyzer1.export_chain(chain1, output_file1)
- print(f"\n Enhanced chain exported to: {output_file1}")
- 
- # IFTTT Chain
- print("\n" + "=" * 80)
- print("IFTTT Integration Chain")
- print("=" * 80)
- analyzer2, chain2 = create_ifttt_integration_chain()
- is_valid, issues = chain2.validate_chain()
- print(chain2.get_chain_summary())
- if not is_valid:
- print("\n Validation Issues:")
- for issue in issues:
- print(f" {issue}")
- analyzer2.chains.append(chain2)
- 
- # Export
- output_file2 = "irobot_ifttt_chain.json"
- analyzer2.export_chain(chain2, output_file2)
- print(f"\n IFTTT chain exported to: {output_file2}")
- 
- print("\n" + "=" * 80)
- print("SUMMARY")
- print("=" * 80)
- print(f"Enhanced Chain: {len(chain1.steps)} steps, Impact: {chain1.impact.value}")
- print(f"IFTTT Chain: {len(chain2.steps)} steps, Impact: {chain2.impact.value}")
- print("\n New chains created with discovered endpoints!")
+def create_enhanced_irobot_chain():
+ """Enhanced iRobot chain with new discoveries"""
+ return build_standalone_chain(_ENHANCED_IROBOT_SPEC)
+
+def create_ifttt_integration_chain():
+ """Attack chain via IFTTT integration"""
+ return build_standalone_chain(_IFTTT_SPEC)
 
+if __name__ == "__main__":
+ # Only needed when run as a script
+ import argparse
+ 
+ parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+ parser.add_argument("--validate", action="store_true", help="Validate each chain and report issues")
+ args = parser.parse_args()
+ 
+ print(banner("ENHANCED ATTACK CHAINS - NEW DISCOVERIES") + "\n")
+ 
+ chain1, chain2 = (builder()[1] for builder in (create_enhanced_irobot_chain, create_ifttt_integration_chain))
+ 
+ for chain, heading in (
+  (chain1, "Enhanced iRobot Chain: Discovery API → MQTT → Robot Control"),
+  (chain2, "IFTTT Integration Chain"),
+ ):
+  print(chain_report(chain, heading, validate=args.validate))
+ 
+ # Export both chains
+ output_file = "irobot_enhanced_chains.json"
+ ChainAnalyzer().export_chains((chain1, chain2), output_file)
+ print(f"\n Chains exported to: {output_file}")
+ 
+ print("\n".join((
+  "\n" + banner("SUMMARY"),
+  f"Enhanced Chain: {len(chain1.steps)} steps, Impact: {chain1.impact.value}",
+  f"IFTTT Chain: {len(chain2.steps)} steps, Impact: {chain2.impact.value}",
+  "\n New chains created with discovered endpoints!"
+ )))
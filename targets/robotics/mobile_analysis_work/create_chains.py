@@ -19,211 +19,174 @@ HOW IT CONNECTS TO THE FRAMEWORK:
 
 USAGE:
  python targets/robotics/mobile_analysis_work/create_chains.py
+ python -m targets.robotics.mobile_analysis_work.create_chains
+ python targets/robotics/mobile_analysis_work/create_chains.py --validate
 """
 
 import sys
 import os
+import importlib.util
 
-# Add chains directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'chains'))
+# Add repo root to path
+if importlib.util.find_spec("chains") is None:
+ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from chain_analyzer import (
- ChainAnalyzer, ChainStep, VulnerabilityType, ImpactLevel
+from chains.chain_analyzer import (
+ ChainAnalyzer, VulnerabilityType, ImpactLevel
+)
+from chains.chain_spec import ChainSpec, build_standalone_chain
+from chains.script_output import banner, chain_report
+from chains._strings import (
+ MOBILE_RE_DESCRIPTION, IROBOT_HOME_CONTEXT, IROBOT_HOME_APP,
+ DECOMPILED_CODE_ACCESS, MOBILE_APP_ANALYSIS, JAVA_CODE_ANALYSIS,
+ ROBOT_CONTROL_API, ROBOT_CONTROL_ACHIEVED
 )
 
-def create_dji_chain():
- """Create attack chain for DJI GO findings"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
+# Static chain definitions
+_DJI_OUTCOME_1 = sys.intern("Firebase database endpoint discovered")
+_DJI_OUTCOME_2 = sys.intern("Firebase database access status determined")
+_DJI_OUTCOME_3 = sys.intern("Sensitive drone/user data accessed")
+_DJI_OUTCOME_4 = sys.intern("Flight control API endpoints identified")
+
+_DJI_SPEC = ChainSpec(
  title="DJI GO 4 - Firebase Database to Drone Control",
- description="Chained vulnerabilities discovered via mobile app reverse engineering",
- impact=ImpactLevel.HIGH
- )
- 
- chain.prerequisites = [
- "DJI GO 4 mobile app",
- "Access to decompiled app code"
- ]
- chain.context = "DJI GO 4 drone control application"
- chain.tags = {"dji", "drone", "mobile-app", "firebase", "api"}
- chain.severity = "High"
- 
- # Step 1: Reverse Engineering
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Reverse engineered DJI GO 4 mobile app to discover Firebase database URL",
- endpoint="Mobile app analysis: apktool + jadx",
- payload="Extracted: https://djigo4-f53cb.firebaseio.com",
- outcome="Firebase database endpoint discovered"
- )
- 
- # Step 2: Firebase Access
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Test Firebase database for unauthenticated access",
- endpoint="https://djigo4-f53cb.firebaseio.com/.json",
- prerequisites=["Firebase database endpoint discovered"],
- outcome="Firebase database access status determined"
- )
- 
- # Step 3: Data Extraction
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Extract drone information, user data, or flight records from Firebase",
- endpoint="https://djigo4-f53cb.firebaseio.com/",
- prerequisites=["Firebase database access status determined"],
- outcome="Sensitive drone/user data accessed"
+ description=MOBILE_RE_DESCRIPTION,
+ impact=ImpactLevel.HIGH,
+ severity="High",
+ context="DJI GO 4 drone control application",
+ prerequisites=(
+  "DJI GO 4 mobile app",
+  DECOMPILED_CODE_ACCESS
+ ),
+ tags=frozenset({"dji", "drone", "mobile-app", "firebase", "api"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: Reverse Engineering
+  (1, VulnerabilityType.OTHER,
+   "Reverse engineered DJI GO 4 mobile app to discover Firebase database URL",
+   MOBILE_APP_ANALYSIS,
+   "Extracted: https://djigo4-f53cb.firebaseio.com",
+   (),
+   _DJI_OUTCOME_1),
+  # Step 2: Firebase Access
+  (2, VulnerabilityType.OTHER,
+   "Test Firebase database for unauthenticated access",
+   "https://djigo4-f53cb.firebaseio.com/.json",
+   None,
+   (_DJI_OUTCOME_1,),
+   _DJI_OUTCOME_2),
+  # Step 3: Data Extraction
+  (3, VulnerabilityType.OTHER,
+   "Extract drone information, user data, or flight records from Firebase",
+   "https://djigo4-f53cb.firebaseio.com/",
+   None,
+   (_DJI_OUTCOME_2,),
+   _DJI_OUTCOME_3),
+  # Step 4: Flight Control API Discovery
+  (4, VulnerabilityType.OTHER,
+   "Discover flight control API endpoints from app code (auto takeoff, landing, return home)",
+   JAVA_CODE_ANALYSIS,
+   None,
+   (_DJI_OUTCOME_3,),
+   _DJI_OUTCOME_4)
  )
- 
- # Step 4: Flight Control API Discovery
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Discover flight control API endpoints from app code (auto takeoff, landing, return home)",
- endpoint="Java code analysis",
- prerequisites=["Sensitive drone/user data accessed"],
- outcome="Flight control API endpoints identified"
+)
+
+_IROBOT_OUTCOME_1 = sys.intern("Cloud API endpoints and status endpoint discovered")
+_IROBOT_OUTCOME_2 = sys.intern("Status endpoint information gathered")
+_IROBOT_OUTCOME_3 = sys.intern("Cloud API base URL and endpoints identified")
+_IROBOT_OUTCOME_4 = sys.intern("Unauthorized access to robot control API achieved")
+_IROBOT_OUTCOME_5 = ROBOT_CONTROL_ACHIEVED
+
+_IROBOT_SPEC = ChainSpec(
+ title="iRobot Home - Cloud API to Robot Control",
+ description=MOBILE_RE_DESCRIPTION,
+ impact=ImpactLevel.HIGH,
+ severity="High",
+ context=IROBOT_HOME_CONTEXT,
+ prerequisites=(
+  IROBOT_HOME_APP,
+  DECOMPILED_CODE_ACCESS
+ ),
+ tags=frozenset({"irobot", "roomba", "mobile-app", "cloud-api", "iot"}),
+ # (step_number, vulnerability_type, description, endpoint, payload, prerequisites, outcome)
+ steps=(
+  # Step 1: Reverse Engineering
+  (1, VulnerabilityType.OTHER,
+   "Reverse engineered iRobot Home app to discover cloud API endpoints",
+   MOBILE_APP_ANALYSIS,
+   "Discovered: App/Cloud-api references, status.irobot.com",
+   (),
+   _IROBOT_OUTCOME_1),
+  # Step 2: Status Endpoint Testing
+  (2, VulnerabilityType.OTHER,
+   "Test status endpoint for information disclosure",
+   "https://status.irobot.com",
+   None,
+   (_IROBOT_OUTCOME_1,),
+   _IROBOT_OUTCOME_2),
+  # Step 3: Cloud API Discovery
+  (3, VulnerabilityType.OTHER,
+   "Discover cloud API base URL and endpoints from Java code",
+   JAVA_CODE_ANALYSIS,
+   None,
+   (_IROBOT_OUTCOME_2,),
+   _IROBOT_OUTCOME_3),
+  # Step 4: Authentication Bypass
+  (4, VulnerabilityType.AUTH_BYPASS,
+   "Test cloud API for authentication bypass or weak authentication",
+   "Cloud API endpoints",
+   None,
+   (_IROBOT_OUTCOME_3,),
+   _IROBOT_OUTCOME_4),
+  # Step 5: Robot Control
+  (5, VulnerabilityType.BUSINESS_LOGIC,
+   "Execute unauthorized robot commands (start, stop, schedule)",
+   ROBOT_CONTROL_API,
+   None,
+   (_IROBOT_OUTCOME_4,),
+   _IROBOT_OUTCOME_5)
  )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- 
- return analyzer, chain
+)
+
+def create_dji_chain():
+ """Create attack chain for DJI GO findings"""
+ return build_standalone_chain(_DJI_SPEC)
 
 def create_irobot_chain():
  """Create attack chain for iRobot findings"""
- 
- analyzer = ChainAnalyzer()
- 
- chain = analyzer.create_chain(
- title="iRobot Home - Cloud API to Robot Control",
- description="Chained vulnerabilities discovered via mobile app reverse engineering",
- impact=ImpactLevel.HIGH
- )
- 
- chain.prerequisites = [
- "iRobot Home mobile app",
- "Access to decompiled app code"
- ]
- chain.context = "iRobot Home robot vacuum control application"
- chain.tags = {"irobot", "roomba", "mobile-app", "cloud-api", "iot"}
- chain.severity = "High"
- 
- # Step 1: Reverse Engineering
- step1 = ChainStep(
- step_number=1,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Reverse engineered iRobot Home app to discover cloud API endpoints",
- endpoint="Mobile app analysis: apktool + jadx",
- payload="Discovered: App/Cloud-api references, status.irobot.com",
- outcome="Cloud API endpoints and status endpoint discovered"
- )
- 
- # Step 2: Status Endpoint Testing
- step2 = ChainStep(
- step_number=2,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Test status endpoint for information disclosure",
- endpoint="https://status.irobot.com",
- prerequisites=["Cloud API endpoints and status endpoint discovered"],
- outcome="Status endpoint information gathered"
- )
- 
- # Step 3: Cloud API Discovery
- step3 = ChainStep(
- step_number=3,
- vulnerability_type=VulnerabilityType.OTHER,
- description="Discover cloud API base URL and endpoints from Java code",
- endpoint="Java code analysis",
- prerequisites=["Status endpoint information gathered"],
- outcome="Cloud API base URL and endpoints identified"
- )
- 
- # Step 4: Authentication Bypass
- step4 = ChainStep(
- step_number=4,
- vulnerability_type=VulnerabilityType.AUTH_BYPASS,
- description="Test cloud API for authentication bypass or weak authentication",
- endpoint="Cloud API endpoints",
- prerequisites=["Cloud API base URL and endpoints identified"],
- outcome="Unauthorized access to robot control API achieved"
- )
- 
- # Step 5: Robot Control
- step5 = ChainStep(
- step_number=5,
- vulnerability_type=VulnerabilityType.BUSINESS_LOGIC,
- description="Execute unauthorized robot commands (start, stop, schedule)",
- endpoint="Robot control API",
- prerequisites=["Unauthorized access to robot control API achieved"],
- outcome="Unauthorized robot control achieved"
- )
- 
- chain.add_step(step1)
- chain.add_step(step2)
- chain.add_step(step3)
- chain.add_step(step4)
- chain.add_step(step5)
- 
- return analyzer, chain
+ return build_standalone_chain(_IROBOT_SPEC)
 
 if __name__ == "__main__":
- print("=" * 80)
- print("CREATING ATTACK CHAINS FROM MOBILE APP ANALYSIS")
- print("=" * 80)
- print()
- 
- # DJI Chain
- print("\n" + "=" * 80)
- print("DJI GO 4 Attack Chain")
- print("=" * 80)
- analyzer1, chain1 = create_dji_chain()
- is_valid, issues = chain1.validate_chain()
- print(chain1.get_chain_summary())
- if not is_valid:
- print("\n Validation Issues:")
- for issue in issues:
- print(f" {issue}")
- analyzer1.chains.append(chain1)
- 
- # Export DJI chain
- output_file1 = "dji_attack_chain.json"
- analyzer1.export_chain(chain1, output_file1)
- print(f"\n DJI chain exported to: {output_file1}")
- 
- # iRobot Chain
- print("\n" + "=" * 80)
- print("iRobot Home Attack Chain")
- print("=" * 80)
- analyzer2, chain2 = create_irobot_chain()
- is_valid, issues = chain2.validate_chain()
- print(chain2.get_chain_summary())
- if not is_valid:
- print("\n Validation Issues:")
- for issue in issues:
- print(f" {issue}")
- analyzer2.chains.append(chain2)
- 
- # Export iRobot chain
- output_file2 = "irobot_attack_chain.json"
- analyzer2.export_chain(chain2, output_file2)
- print(f"\n iRobot chain exported to: {output_file2}")
- 
- print("\n" + "=" * 80)
- print("SUMMARY")
- print("=" * 80)
- print(f"DJI Chain: {len(chain1.steps)} steps, Impact: {chain1.impact.value}")
- print(f"iRobot Chain: {len(chain2.steps)} steps, Impact: {chain2.impact.value}")
- print("\n Both chains created and exported!")
- print("\nNext steps:")
- print(" 1. Test discovered endpoints")
- print(" 2. Validate chain feasibility")
- print(" 3. Generate reports with visualizer.py")
-
+ # Only needed when run as a script
+ import argparse
+ 
+ parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+ parser.add_argument("--validate", action="store_true", help="Validate each chain and report issues")
+ args = parser.parse_args()
+ 
+ print(banner("CREATING ATTACK CHAINS FROM MOBILE APP ANALYSIS") + "\n")
+ 
+ chain1, chain2 = (builder()[1] for builder in (create_dji_chain, create_irobot_chain))
+ 
+ for chain, heading in (
+  (chain1, "DJI GO 4 Attack Chain"),
+  (chain2, "iRobot Home Attack Chain"),
+ ):
+  print(chain_report(chain, heading, validate=args.validate))
+ 
+ # Export both chains
+ output_file = "mobile_attack_chains.json"
+ ChainAnalyzer().export_chains((chain1, chain2), output_file)
+ print(f"\n Chains exported to: {output_file}")
+ 
+ print("\n".join((
+  "\n" + banner("SUMMARY"),
+  f"DJI Chain: {len(chain1.steps)} steps, Impact: {chain1.impact.value}",
+  f"iRobot Chain: {len(chain2.steps)} steps, Impact: {chain2.impact.value}",
+  "\n Both chains created and exported!",
+  "\nNext steps:",
+  " 1. Test discovered endpoints",
+  " 2. Validate chain feasibility",
+  " 3. Generate reports with visualizer.py"
+ )))
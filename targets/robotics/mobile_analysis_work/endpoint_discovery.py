@@ -16,84 +16,103 @@ HOW IT CONNECTS TO THE FRAMEWORK:
 - Discovers endpoints for attack chain creation
 - Outputs findings used by create_chains.py
 - Integrates with mobile_app_workflow.sh
+- Per-file scanning lives in scanner_core.py (optionally compiled)
 
 USAGE:
  python targets/robotics/mobile_analysis_work/endpoint_discovery.py decompiled/
+ ENDPOINT_DISCOVERY_SKIP_DIRS=smali,original python targets/robotics/mobile_analysis_work/endpoint_discovery.py decompiled/
 """
 
 import os
-import re
+import sys
+from itertools import islice
 from pathlib import Path
 
+try:
+ from . import scanner_core
+except ImportError: # run as a script rather than as part of the package
+ import scanner_core
+
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_MIN_FILES = 256
+# Files handed to a worker per task, to amortize the pickling round trip
+_SCAN_CHUNKSIZE = 64
+
 def find_api_endpoints(decompiled_dir):
  """Find API endpoints in decompiled Java code"""
  endpoints = {
- "base_urls": [],
- "api_endpoints": [],
- "firebase_urls": [],
- "service_urls": [],
- "api_classes": []
+  "base_urls": [],
+  "api_endpoints": [],
+  "firebase_urls": [],
+  "service_urls": [],
+  "api_classes": []
  }
+ # Lists keep report order; sets make the already-seen check O(1)
+ seen = {category: set() for category in endpoints}
  
  decompiled_path = Path(decompiled_dir)
  
  if not decompiled_path.exists():
- print(f" Decompiled directory not found: {decompiled_dir}")
- return endpoints
- 
- # Patterns to search for
- patterns = {
- "base_urls": [
- r'BASE_URL\s*=\s*["\']([^"\']+)["\']',
- r'baseUrl\s*=\s*["\']([^"\']+)["\']',
- r'base_url\s*=\s*["\']([^"\']+)["\']',
- r'API_BASE\s*=\s*["\']([^"\']+)["\']',
- ],
- "api_endpoints": [
- r'https://[^"\'\s]+api[^"\'\s]*',
- r'https://[^"\'\s]+\.irobot[^"\'\s]*',
- r'https://[^"\'\s]+iot\.irobotapi[^"\'\s]*',
- ],
- "firebase_urls": [
- r'https://[^"\'\s]+firebaseio\.com[^"\'\s]*',
- ],
- "service_urls": [
- r'https://[^"\'\s]+execute-api[^"\'\s]*',
- r'https://[^"\'\s]+\.amazonaws\.com[^"\'\s]*',
- ]
- }
+  print(f" Decompiled directory not found: {decompiled_dir}")
+  return endpoints
  
  # Search Java files
- java_files = list(decompiled_path.rglob("*.java"))
- print(f" Searching {len(java_files)} Java files...")
- 
- for java_file in java_files:
+ print(" Searching Java files...")
+ scanner_core.clear_scan_cache()
+ java_files = scanner_core.walk_java(str(decompiled_path))
+ # Only buffer enough paths to decide whether a pool is worth starting
+ head = list(islice(java_files, _PARALLEL_MIN_FILES))
+ 
+ # Scan large trees on every core; map() keeps results in file order
+ if len(head) >= _PARALLEL_MIN_FILES:
+  from concurrent.futures import ProcessPoolExecutor
+  # Executor.map() submits every chunk up front, so finish the walk here
+  paths = head
+  paths.extend(java_files)
+  executor = ProcessPoolExecutor()
+  results = executor.map(scanner_core.scan_one, paths, chunksize=_SCAN_CHUNKSIZE)
+ else:
+  paths = head
+  executor = None
+  results = map(scanner_core.scan_one, head)
+ 
+ file_count = 0
+ # "Found" lines are printed after the scan
+ found_lines = []
  try:
- with open(java_file, 'r', encoding='utf-8', errors='ignore') as f:
- content = f.read()
- 
- # Search for patterns
- for category, pattern_list in patterns.items():
- for pattern in pattern_list:
- matches = re.findall(pattern, content, re.IGNORECASE)
- for match in matches:
- if isinstance(match, tuple):
- match = match[0] if match else ""
- if match and match not in endpoints[category]:
- endpoints[category].append(match)
- print(f" Found {category}: {match}")
- 
- # Find API classes
- if re.search(r'class\s+\w*Api\w*|class\s+\w*API\w*|class\s+\w*Client\w*', content, re.IGNORECASE):
- rel_path = str(java_file.relative_to(decompiled_path))
- if rel_path not in endpoints["api_classes"]:
- endpoints["api_classes"].append(rel_path)
- 
- except Exception as e:
- continue
- 
+  for java_file, result in zip(paths, results):
+   file_count += 1
+   if result is None:
+    continue
+   found, is_api_class = result
+   for category, matches in found.items():
+    for match in matches:
+     if match not in seen[category]:
+      seen[category].add(match)
+      endpoints[category].append(match)
+      found_lines.append(f" Found {category}: {match}\n")
+ 
+   if is_api_class:
+    rel_path = os.path.relpath(java_file, decompiled_path)
+    if rel_path not in seen["api_classes"]:
+     seen["api_classes"].add(rel_path)
+     endpoints["api_classes"].append(rel_path)
+ finally:
+  if executor is not None:
+   executor.shutdown()
+ 
+ sys.stdout.write("".join(found_lines))
+ print(f" Searched {file_count} Java files")
  return endpoints
 
+# Report sections listing every URL found, in report order
+_URL_SECTIONS = (
+ ("base_urls", " Base URLs:"),
+ ("api_endpoints", " API Endpoints:"),
+ ("firebase_urls", " Firebase URLs:"),
+ ("service_urls", " Service URLs:"),
+)
+
 def generate_report(endpoints):
  """Generate a report of discovered endpoints"""
  report = []
@@ -102,59 +121,39 @@ def generate_report(endpoints):
  report.append("=" * 80)
  report.append("")
  
- if endpoints["base_urls"]:
- report.append(" Base URLs:")
- for url in endpoints["base_urls"]:
- report.append(f" - {url}")
- report.append("")
- 
- if endpoints["api_endpoints"]:
- report.append(" API Endpoints:")
- for url in endpoints["api_endpoints"]:
- report.append(f" - {url}")
- report.append("")
- 
- if endpoints["firebase_urls"]:
- report.append(" Firebase URLs:")
- for url in endpoints["firebase_urls"]:
- report.append(f" - {url}")
- report.append("")
- 
- if endpoints["service_urls"]:
- report.append(" Service URLs:")
- for url in endpoints["service_urls"]:
- report.append(f" - {url}")
- report.append("")
+ for category, heading in _URL_SECTIONS:
+  if endpoints[category]:
+   report.append(heading)
+   report.extend(f" - {url}" for url in endpoints[category])
+   report.append("")
  
  if endpoints["api_classes"]:
- report.append(" API Classes Found:")
- for cls in endpoints["api_classes"][:20]: # Limit to first 20
- report.append(f" - {cls}")
- if len(endpoints["api_classes"]) > 20:
- report.append(f" ... and {len(endpoints["api_classes"]) - 20} more")
- report.append("")
+  report.append(" API Classes Found:")
+  for cls in endpoints["api_classes"][:20]: # Limit to first 20
+   report.append(f" - {cls}")
+  if len(endpoints["api_classes"]) > 20:
+   report.append(f" ... and {len(endpoints['api_classes']) - 20} more")
+  report.append("")
  
  return "\n".join(report)
 
 if __name__ == "__main__":
- import sys
- 
  decompiled_dir = "decompiled"
  if len(sys.argv) > 1:
- decompiled_dir = sys.argv[1]
+  decompiled_dir = sys.argv[1]
  
  print(" Starting API Endpoint Discovery...")
  print("")
  
  endpoints = find_api_endpoints(decompiled_dir)
  
+ report = generate_report(endpoints)
  print("")
- print(generate_report(endpoints))
+ print(report)
  
  # Save to file
  output_file = "java_endpoint_discovery.txt"
  with open(output_file, 'w') as f:
- f.write(generate_report(endpoints))
+  f.write(report)
  
  print(f" Report saved to: {output_file}")
-
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Scanner Core - Per-File Hot Path of the Endpoint Discovery Scan
+Author: Victor Ibhafidon
+
+Holds the compiled patterns, prefilters, directory walk and per-file scan
+used by endpoint_discovery.py, kept apart so this module alone can be
+compiled ahead of time.
+
+WHAT IT DOES:
+- Walks a decompiled tree for .java files
+- Scans one file for base URLs, API/Firebase/AWS endpoints and API classes
+- Skips pattern work on files that can't contain a match
+
+HOW IT CONNECTS TO THE FRAMEWORK:
+- Imported by endpoint_discovery.py, which merges the per-file results
+- Runs inside endpoint_discovery's worker processes on large trees
+
+USAGE:
+ Plain Python needs no build step. For a compiled build, run one of these
+ in this directory; Python loads the resulting extension module in
+ preference to scanner_core.py:
+ cythonize -i -3 scanner_core.py
+ mypyc scanner_core.py
+"""
+
+import hashlib
+import mmap
+import os
+import re
+
+try:
+ import hyperscan
+except ImportError: # optional prefilter; every file gets the full re scan otherwise
+ hyperscan = None
+
+# Patterns to search for
+_PATTERNS = {
+ "base_urls": [
+  r'BASE_URL\s*=\s*["\']([^"\']+)["\']',
+  r'baseUrl\s*=\s*["\']([^"\']+)["\']',
+  r'base_url\s*=\s*["\']([^"\']+)["\']',
+  r'API_BASE\s*=\s*["\']([^"\']+)["\']',
+ ],
+ "api_endpoints": [
+  r'https://[^"\'\s]+api[^"\'\s]*',
+  r'https://[^"\'\s]+\.irobot[^"\'\s]*',
+  r'https://[^"\'\s]+iot\.irobotapi[^"\'\s]*',
+ ],
+ "firebase_urls": [
+  r'https://[^"\'\s]+firebaseio\.com[^"\'\s]*',
+ ],
+ "service_urls": [
+  r'https://[^"\'\s]+execute-api[^"\'\s]*',
+  r'https://[^"\'\s]+\.amazonaws\.com[^"\'\s]*',
+ ]
+}
+
+# One bytes alternation per category, run over memory-mapped files; kept
+# separate because a URL can belong to several categories
+_CATEGORY_RES = {
+ category: re.compile("|".join(f"(?:{p})" for p in pattern_list).encode(), re.IGNORECASE)
+ for category, pattern_list in _PATTERNS.items()
+}
+
+# [\w\x80-\xff] keeps matching non-ASCII identifiers in bytes mode
+_API_CLASS_RE = re.compile(rb'class\s+[\w\x80-\xff]*(?:api|client)[\w\x80-\xff]*', re.IGNORECASE)
+
+# Per category: (all required, at least one of) lower-case literals
+_CATEGORY_LITERALS = {
+ "base_urls": ((), (b"base_url", b"baseurl", b"api_base")),
+ "api_endpoints": ((b"https://",), (b"api", b".irobot")),
+ "firebase_urls": ((b"https://",), (b"firebaseio.com",)),
+ "service_urls": ((b"https://",), (b"execute-api", b".amazonaws.com")),
+ "api_classes": ((b"class",), (b"api", b"client")),
+}
+
+_LITERALS = frozenset(
+ literal for groups in _CATEGORY_LITERALS.values() for group in groups for literal in group
+)
+# Windows overlap so no literal is split across two
+_LITERAL_WINDOW = 256 * 1024
+_LITERAL_OVERLAP = max(len(literal) for literal in _LITERALS) - 1
+
+def _literal_candidates(content):
+ """Categories whose required literals all occur in content"""
+ # Substring search over lower-cased text stands in for IGNORECASE
+ if len(content) <= _LITERAL_WINDOW:
+  # Single window: test literals lazily
+  has = content[:].lower().__contains__
+ else:
+  # Larger files: collect literals window by window
+  found = set()
+  missing = set(_LITERALS)
+  for start in range(0, len(content), _LITERAL_WINDOW):
+   window = content[start:start + _LITERAL_WINDOW + _LITERAL_OVERLAP].lower()
+   hits = {literal for literal in missing if literal in window}
+   found |= hits
+   missing -= hits
+   if not missing:
+    break
+  has = found.__contains__
+ return {
+  category
+  for category, (required, any_of) in _CATEGORY_LITERALS.items()
+  if all(has(literal) for literal in required) and any(has(literal) for literal in any_of)
+ }
+
+def _build_prefilter():
+ """
+ Compile every pattern into one Hyperscan database, returning (database,
+ category per pattern id), or (None, None) without hyperscan or if it
+ fails to compile the patterns
+ 
+ Hyperscan reports match offsets but not capture groups or re's
+ leftmost-greedy extents, so it only answers "can this category match this
+ file?" in a single pass; the re patterns still extract the matches.
+ """
+ if hyperscan is None:
+  return None, None
+ flat = [
+  (category, p.encode()) for category, pattern_list in _PATTERNS.items() for p in pattern_list
+ ]
+ flat.append(("api_classes", _API_CLASS_RE.pattern))
+ try:
+  database = hyperscan.Database()
+  database.compile(
+   expressions=[p for _, p in flat],
+   ids=list(range(len(flat))),
+   elements=len(flat),
+   flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(flat)
+  )
+ except Exception:
+  # Fall back to the literal prefilter
+  return None, None
+ return database, [category for category, _ in flat]
+
+# Built at import so worker processes compile their own copy
+_PREFILTER_DB, _PREFILTER_CATEGORIES = _build_prefilter()
+
+def _candidate_categories(content):
+ """
+ Categories (including "api_classes") that may match content, from the
+ exact Hyperscan prefilter when available, else from the required literals
+ """
+ if _PREFILTER_DB is None:
+  return _literal_candidates(content)
+ hits = set()
+ def on_match(pattern_id, start, end, flags, context):
+  hits.add(_PREFILTER_CATEGORIES[pattern_id])
+ try:
+  _PREFILTER_DB.scan(content, match_event_handler=on_match)
+ except Exception:
+  # Don't let a prefilter failure hide matches; fall back to the literals
+  return _literal_candidates(content)
+ return hits
+
+# apktool/jadx output directories without app code; override with
+# ENDPOINT_DISCOVERY_SKIP_DIRS (comma-separated, empty walks everything)
+_DEFAULT_SKIP_DIRS = "smali,original,kotlin,unknown,META-INF"
+_SKIP_DIRS = frozenset(
+ name.strip()
+ for name in os.environ.get("ENDPOINT_DISCOVERY_SKIP_DIRS", _DEFAULT_SKIP_DIRS).split(",")
+ if name.strip()
+)
+
+def walk_java(root):
+ """
+ Yield the path of every .java file under root, lazily
+ 
+ os.scandir() entries carry their file type, so the walk needs no extra
+ stat() per entry and large trees start scanning before the walk ends.
+ Unreadable directories, directories named in _SKIP_DIRS and symlinked
+ directories are not walked.
+ """
+ stack = [root]
+ while stack:
+  try:
+   with os.scandir(stack.pop()) as it:
+    for entry in it:
+     if entry.is_dir(follow_symlinks=False):
+      if entry.name not in _SKIP_DIRS:
+       stack.append(entry.path)
+     elif entry.name.endswith('.java'):
+      yield entry.path
+  except OSError:
+   continue
+
+# Scan results keyed by file content digest; decompiled trees repeat files
+_results_by_digest = {}
+
+def clear_scan_cache():
+ """Drop the per-process results cache (bounds memory between scans)"""
+ _results_by_digest.clear()
+
+def scan_one(path):
+ """
+ Scan one Java file, returning ({category: [matches]}, is_api_class) or
+ None if the file can't be read or can't contain a match. Matches are in
+ file order with duplicates removed. Only uses module-level state, so it
+ can run in a worker process.
+ """
+ try:
+  with open(path, 'rb') as f:
+   # mmap refuses empty files, and there is nothing to find in them
+   if os.fstat(f.fileno()).st_size == 0:
+    return None
+   # Scan the mapped bytes; only matches get decoded
+   with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+    # One cheap pass picks the categories worth an re scan
+    candidates = _candidate_categories(content)
+    # Most files match nothing
+    if not candidates:
+     return None
+ 
+    # Hash only files that survived the prefilter
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    if digest in _results_by_digest:
+     return _results_by_digest[digest]
+ 
+    # Search for patterns
+    found = {category: {} for category in _CATEGORY_RES}
+    for category, pattern in _CATEGORY_RES.items():
+     if category not in candidates:
+      continue
+     for m in pattern.finditer(content):
+      # Patterns with a capture group (base_urls) report the group,
+      # the others the whole match
+      match = (m.group(m.lastindex) if m.lastindex else m.group(0)).decode('utf-8', 'ignore')
+      if match:
+       found[category][match] = None
+ 
+    # Find API classes
+    is_api_class = "api_classes" in candidates and _API_CLASS_RE.search(content) is not None
+ except Exception:
+  return None
+ result = {category: list(matches) for category, matches in found.items()}, is_api_class
+ _results_by_digest[digest] = result
+ return result
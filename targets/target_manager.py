@@ -29,13 +29,137 @@ USAGE:
 """
 
 import subprocess
-import requests
-import json
 import os
-from typing import Dict, Optional, List
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AbstractSet, Dict, Optional, List, Union
 from dataclasses import dataclass
 from enum import Enum
 
+# requests and the docker SDK are imported on first use (see _docker_sdk())
+if TYPE_CHECKING:
+ import requests
+
+class _Probe(Enum):
+ """Sentinel type for check_status()'s running argument"""
+ DOCKER = "docker"
+
+# Default for Target.check_status(running=...): ask Docker directly
+_PROBE_DOCKER = _Probe.DOCKER
+
+# Upper bound on concurrent liveness probes (and pooled connections)
+_PROBE_WORKERS = 8
+
+# Docker SDK client, created on first successful connection
+_docker_sdk_client = None
+
+@functools.lru_cache(maxsize=1)
+def _docker_sdk():
+ """The docker SDK module, imported on first use, or None if not installed"""
+ try:
+  import docker
+ except ImportError: # optional; Docker is driven through the CLI otherwise
+  return None
+ return docker
+
+def _docker_client():
+ """
+ Docker SDK client talking to the daemon's API socket, or None if the
+ docker package is missing or the daemon can't be reached
+ 
+ The API answers the same questions as the CLI without starting a process
+ per call. Failures aren't cached, so a daemon started later is picked up.
+ """
+ global _docker_sdk_client
+ docker = _docker_sdk()
+ if docker is None:
+  return None
+ if _docker_sdk_client is None:
+  try:
+   _docker_sdk_client = docker.from_env()
+  except docker.errors.DockerException:
+   return None
+ return _docker_sdk_client
+
+def _docker_available() -> bool:
+ """Whether Docker can be reached through the SDK or the CLI"""
+ if _docker_client() is not None:
+  return True
+ try:
+  subprocess.run(["docker", "--version"], capture_output=True, check=True, timeout=2)
+ except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+  return False
+ return True
+
+def _running_containers() -> Optional[AbstractSet[str]]:
+ """Names of running Docker containers, or None if `docker ps` fails to run"""
+ client = _docker_client()
+ if client is not None:
+  try:
+   return frozenset(container.name for container in client.containers.list())
+  except Exception:
+   pass # Daemon went away; let the CLI report it
+ try:
+  result = subprocess.run(
+   ["docker", "ps", "--format", "{{.Names}}"],
+   capture_output=True,
+   text=True,
+   timeout=5
+  )
+ except:
+  return None
+ return frozenset(result.stdout.split())
+
+@functools.lru_cache(maxsize=1)
+def _find_docker() -> Optional[str]:
+ """
+ Find docker executable in common locations
+ 
+ Cached, since start()/stop() need it on every call; callers clear the
+ cache on a miss so a Docker installed later is still found.
+ """
+ # Check common paths
+ common_paths = [
+  "/usr/local/bin/docker",
+  "/opt/homebrew/bin/docker",
+  "/Applications/Docker.app/Contents/Resources/bin/docker"
+ ]
+ 
+ for path in common_paths:
+  if os.path.exists(path):
+   return path
+ 
+ # Try PATH
+ try:
+  result = subprocess.run(
+   ["which", "docker"],
+   capture_output=True,
+   text=True,
+   timeout=2
+  )
+  if result.returncode == 0 and result.stdout.strip():
+   return result.stdout.strip()
+ except:
+  pass
+ 
+ # Try direct execution
+ try:
+  result = subprocess.run(
+   ["docker", "--version"],
+   capture_output=True,
+   timeout=2
+  )
+  if result.returncode == 0:
+   return "docker"
+ except:
+  pass
+ 
+ return None
+
+def _daemon_unreachable(error_msg: str) -> bool:
+ """Whether docker CLI stderr says the daemon isn't running"""
+ return "Cannot connect to the Docker daemon" in error_msg or "Is the docker daemon running" in error_msg
+
 class TargetStatus(Enum):
  """Status of a target"""
  RUNNING = "running"
@@ -55,71 +179,66 @@ class Target:
  description: str = ""
  setup_command: Optional[str] = None
  
- def check_status(self) -> TargetStatus:
-  """Check if target is running"""
+ def check_status(self, running: Union[AbstractSet[str], None, _Probe] = _PROBE_DOCKER,
+  session: Optional["requests.Session"] = None) -> TargetStatus:
+  """
+  Check if target is running
+ 
+  Args:
+   running: Container names from _running_containers(), or None if Docker
+    is unavailable, when the caller already asked Docker for several
+    targets; by default Docker is queried for this target alone
+   session: Shared requests session for the URL probe of targets without
+    a container, so probes of several targets reuse pooled connections
+  """
   if self.docker_container:
-   # Check if Docker is available
-   try:
-    subprocess.run(["docker", "--version"], capture_output=True, check=True, timeout=2)
-   except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+   if running is _PROBE_DOCKER:
+    running = _running_containers() if _docker_available() else None
+   if running is None:
     return TargetStatus.UNKNOWN  # Return unknown if Docker not available
-   
-   try:
-    result = subprocess.run(
-     ["docker", "ps", "--format", "{{.Names}}"],
-     capture_output=True,
-     text=True,
-     timeout=5
-    )
-    if self.docker_container in result.stdout:
-     # Check if it's actually responding
-     if self.url:
-      try:
-       response = requests.get(self.url, timeout=2)
-       if response.status_code < 500:
-        return TargetStatus.RUNNING
-      except:
-       pass
-     return TargetStatus.RUNNING
-    return TargetStatus.STOPPED
-   except:
-    return TargetStatus.UNKNOWN
-  
-  if self.url:
-   try:
-    response = requests.get(self.url, timeout=2)
-    if response.status_code < 500:
-     return TargetStatus.RUNNING
-   except:
-    pass
-  
+ 
+   # A running container counts as running; no HTTP probe needed
+   if self.docker_container in running:
+    return TargetStatus.RUNNING
+   return TargetStatus.STOPPED
+ 
+  if self.url and self._responds(session):
+   return TargetStatus.RUNNING
+ 
   return TargetStatus.UNKNOWN
  
+ def _responds(self, session: Optional["requests.Session"]) -> bool:
+  """Whether self.url answers without a server error
+ 
+  Sends HEAD so the status check doesn't download the page body (the
+  Juice Shop index alone is ~1 MB); servers that refuse HEAD get a GET
+  that stops after the headers.
+  """
+  http = session
+  if http is None:
+   import requests as http
+  try:
+   response = http.head(self.url, timeout=2, allow_redirects=False)
+   if response.status_code in (405, 501):
+    response = http.get(self.url, timeout=2, stream=True)
+    response.close()
+   return response.status_code < 500
+  except:
+   return False
+ 
  def start(self) -> bool:
   """Start the target"""
   if self.docker_container:
+   client = _docker_client()
+   if client is not None:
+    return self._start_with_sdk(client)
+ 
    # Check if Docker is available
-   docker_path = self._find_docker()
+   docker_path = _find_docker()
    if not docker_path:
+    _find_docker.cache_clear()
     raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
-   
-   # Verify Docker is actually running
-   try:
-    check_result = subprocess.run(
-     [docker_path, "ps"],
-     capture_output=True,
-     text=True,
-     timeout=5
-    )
-    if check_result.returncode != 0:
-     error_msg = check_result.stderr.strip() if check_result.stderr else "Unknown error"
-     if "Cannot connect to the Docker daemon" in error_msg or "Is the docker daemon running" in error_msg:
-      raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
-   except subprocess.TimeoutExpired:
-    raise RuntimeError("Docker command timed out. Docker Desktop may not be running.")
-   except FileNotFoundError:
-    raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
-   
+ 
    try:
     # Check if container exists
     result = subprocess.run(
@@ -128,13 +247,14 @@ class Target:
      text=True,
      timeout=10
     )
-    
+ 
     if result.returncode != 0:
      error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-     if "Cannot connect to the Docker daemon" in error_msg:
+     # No separate daemon probe; a stopped daemon shows up here
+     if _daemon_unreachable(error_msg):
       raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
      raise RuntimeError(f"Docker command failed: {error_msg}")
-    
+ 
     if self.docker_container in result.stdout:
      # Start existing container
      start_result = subprocess.run(
@@ -161,41 +281,32 @@ class Target:
       raise RuntimeError(f"Failed to create container: {error_msg}")
     else:
      return False
-    
+ 
     return True
    except subprocess.TimeoutExpired:
     raise RuntimeError("Docker command timed out. The operation may be taking too long.")
+   except FileNotFoundError:
+    _find_docker.cache_clear()
+    raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
    except RuntimeError:
     raise  # Re-raise RuntimeError
    except Exception as e:
     raise RuntimeError(f"Unexpected error: {str(e)}")
-  
+ 
   return False
  
  def stop(self) -> bool:
   """Stop the target"""
   if self.docker_container:
-   docker_path = self._find_docker()
+   client = _docker_client()
+   if client is not None:
+    return self._stop_with_sdk(client)
+ 
+   docker_path = _find_docker()
    if not docker_path:
+    _find_docker.cache_clear()
     raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
-   
-   # Verify Docker is actually running
-   try:
-    check_result = subprocess.run(
-     [docker_path, "ps"],
-     capture_output=True,
-     text=True,
-     timeout=5
-    )
-    if check_result.returncode != 0:
-     error_msg = check_result.stderr.strip() if check_result.stderr else "Unknown error"
-     if "Cannot connect to the Docker daemon" in error_msg or "Is the docker daemon running" in error_msg:
-      raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
-   except subprocess.TimeoutExpired:
-    raise RuntimeError("Docker command timed out. Docker Desktop may not be running.")
-   except FileNotFoundError:
-    raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
-   
+ 
    try:
     stop_result = subprocess.run(
      [docker_path, "stop", self.docker_container],
@@ -206,7 +317,7 @@ class Target:
     )
     if stop_result.returncode != 0:
      error_msg = stop_result.stderr.strip() if stop_result.stderr else "Unknown error"
-     if "Cannot connect to the Docker daemon" in error_msg:
+     if _daemon_unreachable(error_msg):
       raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
      # Container might not be running, which is OK
      if "is not running" in error_msg.lower():
@@ -215,57 +326,58 @@ class Target:
     return True
    except subprocess.TimeoutExpired:
     raise RuntimeError("Docker command timed out. The operation may be taking too long.")
+   except FileNotFoundError:
+    _find_docker.cache_clear()
+    raise FileNotFoundError("Docker is not installed or not in PATH. Please install Docker Desktop from https://www.docker.com/products/docker-desktop/")
    except RuntimeError:
     raise  # Re-raise RuntimeError
    except Exception as e:
     raise RuntimeError(f"Unexpected error: {str(e)}")
   return False
  
- def _find_docker(self) -> Optional[str]:
-  """Find docker executable in common locations"""
-  # Check common paths
-  common_paths = [
-   "/usr/local/bin/docker",
-   "/opt/homebrew/bin/docker",
-   "/Applications/Docker.app/Contents/Resources/bin/docker"
-  ]
-  
-  for path in common_paths:
-   if os.path.exists(path):
-    return path
-  
-  # Try PATH
+ def _start_with_sdk(self, client) -> bool:
+  """start() through the Docker API: start the container, creating it if needed"""
+  # Both already loaded by _docker_client(), which supplied client
+  import docker
+  import requests
   try:
-   result = subprocess.run(
-    ["which", "docker"],
-    capture_output=True,
-    text=True,
-    timeout=2
-   )
-   if result.returncode == 0 and result.stdout.strip():
-    return result.stdout.strip()
-  except:
-   pass
-  
-  # Try direct execution
+   try:
+    client.containers.get(self.docker_container).start()
+   except docker.errors.NotFound:
+    if not self.docker_image:
+     return False
+    client.containers.run(
+     self.docker_image,
+     name=self.docker_container,
+     detach=True,
+     ports={f"{self.port}/tcp": self.port}
+    )
+   return True
+  except docker.errors.APIError as e:
+   raise RuntimeError(f"Failed to start container: {e.explanation or e}")
+  except (docker.errors.DockerException, requests.exceptions.ConnectionError):
+   raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
+ 
+ def _stop_with_sdk(self, client) -> bool:
+  """stop() through the Docker API; stopping a stopped container succeeds"""
+  # Both already loaded by _docker_client(), which supplied client
+  import docker
+  import requests
   try:
-   result = subprocess.run(
-    ["docker", "--version"],
-    capture_output=True,
-    timeout=2
-   )
-   if result.returncode == 0:
-    return "docker"
-  except:
-   pass
-  
-  return None
+   client.containers.get(self.docker_container).stop()
+   return True
+  except docker.errors.APIError as e:
+   raise RuntimeError(f"Failed to stop container: {e.explanation or e}")
+  except (docker.errors.DockerException, requests.exceptions.ConnectionError):
+   raise RuntimeError("Docker Desktop is not running. Please start Docker Desktop and try again.")
 
 class TargetManager:
  """Manages multiple pentesting targets"""
  
  def __init__(self):
   self.targets: Dict[str, Target] = {}
+  # Pooled session for liveness probes, created on first status check
+  self._session: Optional["requests.Session"] = None
   self._load_default_targets()
  
  def _load_default_targets(self):
@@ -280,7 +392,7 @@ class TargetManager:
    docker_container="juice-shop",
    description="Modern vulnerable web application with 100+ vulnerabilities"
   )
-  
+ 
   # DVWA
   self.targets["dvwa"] = Target(
    name="Damn Vulnerable Web Application",
@@ -291,7 +403,7 @@ class TargetManager:
    docker_container="dvwa",
    description="Classic vulnerable web application for learning"
   )
-  
+ 
   # bWAPP
   self.targets["bwapp"] = Target(
    name="bWAPP (Buggy Web Application)",
@@ -302,7 +414,7 @@ class TargetManager:
    docker_container="bwapp",
    description="100+ vulnerabilities for practicing"
   )
-  
+ 
   # WebGoat
   self.targets["webgoat"] = Target(
    name="OWASP WebGoat",
@@ -328,10 +440,50 @@ class TargetManager:
  
  def check_all_status(self) -> Dict[str, TargetStatus]:
   """Check status of all targets"""
-  statuses = {}
-  for name, target in self.targets.items():
-   statuses[name] = target.check_status()
-  return statuses
+  if not self.targets:
+   return {}
+ 
+  running = None
+  if any(target.docker_container for target in self.targets.values()):
+   # One `docker ps` answers for every target
+   running = _running_containers() if _docker_available() else None
+ 
+  # Only targets without a container are probed over HTTP
+  needs_http = any(target.url and not target.docker_container for target in self.targets.values())
+  if not needs_http:
+   return {name: target.check_status(running, None) for name, target in self.targets.items()}
+  session = self._get_session()
+ 
+  # Probe targets in parallel
+  with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(self.targets))) as executor:
+   futures = {
+    name: executor.submit(target.check_status, running, session)
+    for name, target in self.targets.items()
+   }
+  return {name: future.result() for name, future in futures.items()}
+ 
+ async def check_all_status_async(self) -> Dict[str, TargetStatus]:
+  """
+  check_all_status() for asyncio callers
+ 
+  The sweep runs in the loop's default executor, so the event loop keeps
+  serving while targets are probed.
+  """
+  import asyncio
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(None, self.check_all_status)
+ 
+ def _get_session(self) -> "requests.Session":
+  """Return the pooled requests session, creating it on first use"""
+  if self._session is None:
+   import requests
+   from requests.adapters import HTTPAdapter
+   session = requests.Session()
+   adapter = HTTPAdapter(pool_connections=_PROBE_WORKERS, pool_maxsize=_PROBE_WORKERS)
+   session.mount("http://", adapter)
+   session.mount("https://", adapter)
+   self._session = session
+  return self._session
  
  def start_target(self, name: str) -> bool:
   """Start a target"""
@@ -354,9 +506,9 @@ class TargetManager:
   report.append("PENTESTING TARGETS STATUS")
   report.append("=" * 80)
   report.append("")
-  
+ 
   statuses = self.check_all_status()
-  
+ 
   for name, target in self.targets.items():
    status = statuses[name]
    status_icon = {
@@ -365,7 +517,7 @@ class TargetManager:
     TargetStatus.UNKNOWN: "",
     TargetStatus.NOT_INSTALLED: ""
    }.get(status, "")
-   
+ 
    report.append(f"{status_icon} {target.name}")
    report.append(f" Type: {target.target_type}")
    report.append(f" Status: {status.value}")
@@ -373,7 +525,7 @@ class TargetManager:
     report.append(f" URL: {target.url}")
    report.append(f" Description: {target.description}")
    report.append("")
-  
+ 
   return "\n".join(report)
 
 if __name__ == "__main__":